@@ -14,7 +14,8 @@ Version: 1.0.0
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 import yaml
 
 
@@ -60,11 +61,19 @@ class ConfigManager:
             },
             'settings': {
                 'solver': 'cbc',
+                'solver_threads': None,  # None = Solver-Standard
+                'solver_mip_gap': None,  # None = Solver-Standard
+                'solver_time_limit': None,  # Sekunden, None = unbegrenzt
+                'solver_warmstart': False,
                 'debug_mode': False,
                 'output_format': 'xlsx',
                 'create_visualizations': True,
                 'create_analysis': False,
+                'parallel_postprocess': True,
+                'enable_cost_breakdown': True,
+                'excel_cache': True,
                 'save_model': False,
+                'log_plain': False,
                 'export_formats': ['json', 'yaml', 'txt']
             },
             'solver_options': {
@@ -181,22 +190,32 @@ class ConfigManager:
         
         return merged
     
-    def get_module_config(self) -> Dict[str, bool]:
+    def get_module_config(self, read_only: bool = False) -> Mapping[str, bool]:
         """
         Gibt die Modul-Konfiguration zurück.
         
+        Args:
+            read_only: Schreibgeschützte Sicht statt Kopie zurückgeben
+        
         Returns:
             Modul-Konfiguration
         """
+        if read_only:
+            return MappingProxyType(self.config['modules'])
         return self.config['modules'].copy()
     
-    def get_settings(self) -> Dict[str, Any]:
+    def get_settings(self, read_only: bool = False) -> Mapping[str, Any]:
         """
         Gibt die allgemeinen Einstellungen zurück.
         
+        Args:
+            read_only: Schreibgeschützte Sicht statt Kopie zurückgeben
+        
         Returns:
             Allgemeine Einstellungen
         """
+        if read_only:
+            return MappingProxyType(self.config['settings'])
         return self.config['settings'].copy()
     
     def get_solver_options(self, solver: str) -> Dict[str, Any]:
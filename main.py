@@ -14,10 +14,18 @@ Datum: Juli 2025
 Version: 1.1.0 (mit System Export)
 """
 
+import heapq
+import logging.handlers
+import os
+import re
 import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 import logging
 
 # Projektmodule importieren
@@ -34,9 +42,98 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Trennlinien der Projekt-Zusammenfassung (einmalig als Konstanten gebildet)
+_SUMMARY_TITLE_RULE = "=" * 60 + "\n\n"
+_SUMMARY_RULE = "-" * 20 + "\n"
+
+# Emoji und Piktogramme, die bei 'log_plain' aus Log-Meldungen entfernt werden
+_EMOJI_PATTERN = re.compile('[\u2300-\u23ff\u2600-\u27bf\ufe0f\U0001f300-\U0001faff]+ ?')
+
+
+class PlainLogFilter(logging.Filter):
+    """Entfernt Emoji aus Log-Meldungen (z.B. für Windows-Konsolen ohne UTF-8)."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, str):
+            record.msg = _EMOJI_PATTERN.sub('', record.msg)
+        return True
+
+
+def _freeze_value(value: Any) -> Any:
+    """Wandelt einen (verschachtelten) Settings-Wert in eine hashbare Form um."""
+    if isinstance(value, Mapping):
+        return ('dict', tuple(sorted(((key, _freeze_value(item)) for key, item in value.items()),
+                                     key=lambda pair: str(pair[0]))))
+    if isinstance(value, (list, tuple)):
+        # Typ mitführen, damit Liste und Tuple nicht denselben Schlüssel ergeben
+        return (type(value).__name__, tuple(_freeze_value(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ('set', frozenset(_freeze_value(item) for item in value))
+    return value
+
+
+def _freeze_settings(settings: Mapping[str, Any]) -> tuple:
+    """Wandelt ein Settings-Dictionary in einen hashbaren Cache-Schlüssel um."""
+    return _freeze_value(settings)
+
+
+# ExcelReader-Instanzen je Konfiguration (Einfügereihenfolge = Alter)
+_EXCEL_READER_CACHE: Dict[tuple, ExcelReader] = {}
+_EXCEL_READER_CACHE_SIZE = 4
+
+
+def _get_excel_reader(settings: Mapping[str, Any]) -> ExcelReader:
+    """
+    Liefert einen ExcelReader für die Konfiguration, einmalig pro Konfiguration erstellt.
+    
+    Nur der ExcelReader ist zustandslos. Optimizer (Optimierungs-Statistiken),
+    SystemBuilder und ResultsProcessor halten projektbezogenen Zustand und
+    werden daher pro Projekt neu erstellt.
+    
+    Args:
+        settings: Settings-Dictionary (auch schreibgeschützte Sicht)
+        
+    Returns:
+        ExcelReader-Instanz
+    """
+    key = _freeze_settings(settings)
+    reader = _EXCEL_READER_CACHE.get(key)
+    
+    if reader is None:
+        if len(_EXCEL_READER_CACHE) >= _EXCEL_READER_CACHE_SIZE:
+            # Älteste Konfiguration verwerfen
+            _EXCEL_READER_CACHE.pop(next(iter(_EXCEL_READER_CACHE)))
+        # Kopie, damit spätere Änderungen an den Settings den Cache-Schlüssel nicht unterlaufen
+        reader = _EXCEL_READER_CACHE[key] = ExcelReader(dict(settings))
+    
+    return reader
+
+
+def _iter_output_files(directory: Path, prefix: str = "", exclude: Optional[str] = None):
+    """
+    Liefert die relativen Namen aller Dateien unterhalb eines Verzeichnisses (os.scandir).
+    
+    Args:
+        directory: Zu durchsuchendes Verzeichnis
+        prefix: Präfix für relative Namen (für Unterverzeichnisse)
+        exclude: Relativer Dateiname, der bereits beim Scan übersprungen wird
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_output_files(entry.path, f"{prefix}{entry.name}/", exclude)
+            elif entry.is_file():
+                name = f"{prefix}{entry.name}"
+                if name != exclude:
+                    yield name
+
+
 class EnergySystemProject:
     """Hauptklasse für die Energiesystemmodellierung."""
     
+    # Gemeinsamer Formatter für Datei- und Konsolen-Log (einmalig erstellt)
+    _LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     def __init__(self, project_file: Path, config: Dict[str, Any]):
         """
         Initialisiert das Energiesystemprojekt.
@@ -49,9 +146,14 @@ class EnergySystemProject:
         self.config = config
         self.project_name = project_file.stem
         
+        # Häufig benötigte Teil-Dictionaries einmalig binden
+        self.settings = config['settings']
+        self.module_config = config['modules']
+        
         # Output-Verzeichnis erstellen
         self.output_dir = Path("data/output") / self.project_name
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self.output_dir.is_dir():
+            os.makedirs(self.output_dir, exist_ok=True)
         
         # Logger konfigurieren
         self.setup_logging()
@@ -62,6 +164,12 @@ class EnergySystemProject:
         self.optimization_model = None
         self.results = None
         
+        # Laufzeiten der einzelnen Schritte (Label → Sekunden)
+        self._timings: Dict[str, float] = {}
+        
+        # Exporter-Status lokal führen: module_config kann schreibgeschützt sein
+        self._exporter_available = bool(self.module_config.get('system_exporter', False))
+        
         # Module initialisieren
         self.initialize_modules()
     
@@ -70,7 +178,7 @@ class EnergySystemProject:
         # FIX: oemof.solph 0.6.0 Logging-Konflikt vermeiden
         # Root-Logger NIEMALS auf DEBUG setzen wegen Pyomo-Performance-Problem
         
-        if self.config['settings']['debug_mode']:
+        if self.settings['debug_mode']:
             # Debug-Modus: Nur unsere Module auf DEBUG, Root-Logger auf INFO
             root_log_level = logging.INFO
             project_log_level = logging.DEBUG
@@ -83,14 +191,32 @@ class EnergySystemProject:
         # Root-Logger auf INFO setzen (oemof.solph Requirement)
         logging.getLogger().setLevel(root_log_level)
         
-        # Logging-Handler konfigurieren
+        # Konsolen-Ausgabe puffern: Meldungen werden gesammelt und an den
+        # Schrittgrenzen (bzw. sofort ab ERROR) gemeinsam auf stdout geschrieben.
+        # logging.shutdown() leert den Puffer beim Programmende.
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(self._LOG_FORMATTER)
+        self._console_buffer = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=console_handler
+        )
+        
+        file_handler = logging.FileHandler(self.output_dir / f"{self.project_name}.log")
+        file_handler.setFormatter(self._LOG_FORMATTER)
+        handlers = [file_handler, self._console_buffer]
+        
+        # Optional: Emoji aus allen Ausgaben entfernen (ein Filter für beide
+        # Handler, direkt beim Erstellen statt nachträglich über Root-Handler)
+        if self.settings.get('log_plain', False):
+            plain_filter = PlainLogFilter()
+            for handler in handlers:
+                handler.addFilter(plain_filter)
+        
+        # Logging-Handler konfigurieren (Formatter sind bereits gesetzt)
         logging.basicConfig(
             level=root_log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.output_dir / f"{self.project_name}.log"),
-                logging.StreamHandler(sys.stdout)
-            ],
+            handlers=handlers,
             force=True  # Bestehende Handler überschreiben
         )
         
@@ -98,14 +224,12 @@ class EnergySystemProject:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(project_log_level)
         
-        # Modul-Logger auf gewünschtes Level setzen
-        if self.config['settings']['debug_mode']:
-            logging.getLogger('modules').setLevel(logging.DEBUG)
-            for module_name in ['excel_reader', 'system_builder', 'optimizer', 
-                              'results_processor', 'visualizer', 'analyzer']:
-                logging.getLogger(f'modules.{module_name}').setLevel(logging.DEBUG)
+        # Modul-Logger auf gewünschtes Level setzen: die einzelnen
+        # 'modules.*'-Logger erben das Level vom Eltern-Logger und geben ihre
+        # Meldungen per Propagation an die Root-Handler weiter
+        logging.getLogger('modules').setLevel(project_log_level)
         
-        self.logger.info(f"🚀 Starte Projekt: {self.project_name} ({self.logger_note})")
+        self.logger.info("🚀 Starte Projekt: %s (%s)", self.project_name, self.logger_note)
     
     def initialize_modules(self):
         """Initialisiert alle verfügbaren Module."""
@@ -113,54 +237,74 @@ class EnergySystemProject:
         
         self.modules = {}
         
-        # Excel Reader (immer erforderlich)
-        self.modules['excel_reader'] = ExcelReader(self.config['settings'])
+        # Excel Reader (immer erforderlich) ist zustandslos und wird über
+        # wiederholte Projektläufe mit gleicher Konfiguration wiederverwendet
+        self.modules['excel_reader'] = _get_excel_reader(self.settings)
         
         # System Builder (immer erforderlich)
-        self.modules['system_builder'] = SystemBuilder(self.config['settings'])
+        self.modules['system_builder'] = SystemBuilder(self.settings)
         
         # Energy System Exporter (optional) - NEU
-        if self.config['modules'].get('system_exporter', False):
+        if self._exporter_available:
             try:
                 from modules.energy_system_exporter import create_export_module
-                self.modules['system_exporter'] = create_export_module(self.config['settings'])
+                self.modules['system_exporter'] = create_export_module(self.settings)
                 self.logger.info("   📤 System-Exporter aktiviert")
             except ImportError as e:
-                self.logger.warning(f"System-Exporter konnte nicht geladen werden: {e}")
-                self.config['modules']['system_exporter'] = False
+                self.logger.warning("System-Exporter konnte nicht geladen werden: %s", e)
+                self._exporter_available = False
         
         # Optimizer (immer erforderlich)
-        self.modules['optimizer'] = Optimizer(self.config['settings'])
+        self.modules['optimizer'] = Optimizer(self.settings)
         
         # Results Processor (immer erforderlich)
         self.modules['results_processor'] = ResultsProcessor(
-            self.output_dir, self.config['settings']
+            self.output_dir, self.settings
         )
         
         # Optionale Module
-        if self.config['modules']['visualizer']:
+        if self.module_config['visualizer']:
             self.modules['visualizer'] = Visualizer(
-                self.output_dir, self.config['settings']
+                self.output_dir, self.settings
             )
         
-        if self.config['modules']['analyzer']:
+        if self.module_config['analyzer']:
             self.modules['analyzer'] = Analyzer(
-                self.output_dir, self.config['settings']
+                self.output_dir, self.settings
             )
         
-        self.logger.info(f"✅ {len(self.modules)} Module initialisiert")
+        self.logger.info("✅ %d Module initialisiert", len(self.modules))
+    
+    @contextmanager
+    def _timed(self, label: str):
+        """
+        Misst die Laufzeit eines Schrittes und protokolliert sie bei Erfolg.
+        
+        Args:
+            label: Beschreibung des Schrittes für Log und Laufzeit-Übersicht
+        """
+        self._console_buffer.flush()
+        start_time = time.perf_counter()
+        try:
+            yield
+            elapsed_time = time.perf_counter() - start_time
+            self._timings[label] = elapsed_time
+            self.logger.info("✅ %s (%.2fs)", label, elapsed_time)
+        finally:
+            self._console_buffer.flush()
     
     def validate_input_file(self) -> bool:
-        """Validiert die Excel-Eingabedatei."""
-        if not self.project_file.exists():
-            self.logger.error(f"❌ Projektdatei nicht gefunden: {self.project_file}")
-            return False
+        """
+        Validiert die Excel-Eingabedatei.
         
+        Die Existenz der Datei wird bereits vom Aufrufer geprüft
+        (ProjectSelector.validate_project bzw. Kommandozeilen-Start).
+        """
         if not self.project_file.suffix.lower() in ['.xlsx', '.xls']:
-            self.logger.error(f"❌ Ungültiges Dateiformat: {self.project_file.suffix}")
+            self.logger.error("❌ Ungültiges Dateiformat: %s", self.project_file.suffix)
             return False
         
-        self.logger.info(f"✅ Eingabedatei validiert: {self.project_file.name}")
+        self.logger.info("✅ Eingabedatei validiert: %s", self.project_file.name)
         return True
     
     def step_1_read_excel(self) -> bool:
@@ -168,25 +312,20 @@ class EnergySystemProject:
         self.logger.info("📊 Schritt 1: Excel-Daten einlesen")
         
         try:
-            start_time = time.time()
-            self.excel_data = self.modules['excel_reader'].read_project_file(self.project_file)
-            
-            self.excel_data = self.modules['excel_reader'].process_excel_data(self.project_file)
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Excel-Daten erfolgreich eingelesen ({elapsed_time:.2f}s)")
+            with self._timed("Excel-Daten erfolgreich eingelesen"):
+                self.excel_data = self.modules['excel_reader'].process_excel_data(self.project_file)
             
             # Kurze Zusammenfassung der eingelesenen Daten
-            summary = self.modules['excel_reader'].get_data_summary(self.excel_data)
-            for key, value in summary.items():
-                self.logger.info(f"   📋 {key}: {value}")
+            if self.logger.isEnabledFor(logging.INFO):
+                summary = self.modules['excel_reader'].get_data_summary(self.excel_data)
+                for key, value in summary.items():
+                    self.logger.info("   📋 %s: %s", key, value)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler beim Einlesen der Excel-Daten: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler beim Einlesen der Excel-Daten: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
@@ -195,69 +334,61 @@ class EnergySystemProject:
         self.logger.info("🏗️  Schritt 2: Energiesystem aufbauen")
         
         try:
-            start_time = time.time()
-            self.energy_system = self.modules['system_builder'].build_energy_system(
-                self.excel_data
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Energiesystem erfolgreich aufgebaut ({elapsed_time:.2f}s)")
+            with self._timed("Energiesystem erfolgreich aufgebaut"):
+                self.energy_system = self.modules['system_builder'].build_energy_system(
+                    self.excel_data
+                )
             
             # System-Zusammenfassung
-            system_info = self.modules['system_builder'].get_system_summary(
-                self.energy_system
-            )
-            for key, value in system_info.items():
-                self.logger.info(f"   🔧 {key}: {value}")
+            if self.logger.isEnabledFor(logging.INFO):
+                system_info = self.modules['system_builder'].get_system_summary(
+                    self.energy_system
+                )
+                for key, value in system_info.items():
+                    self.logger.info("   🔧 %s: %s", key, value)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler beim Aufbau des Energiesystems: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler beim Aufbau des Energiesystems: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
     def step_2_5_export_system(self) -> bool:
         """Schritt 2.5: Energiesystem exportieren (optional) - NEU."""
-        if not self.config['modules'].get('system_exporter', False):
+        if not self._exporter_available:
             self.logger.info("⏭️  Schritt 2.5: System-Export übersprungen (deaktiviert)")
             return True
         
         self.logger.info("📤 Schritt 2.5: Energiesystem exportieren")
         
         try:
-            start_time = time.time()
-            
-            # Export-Verzeichnis erstellen
-            export_dir = self.output_dir / "system_exports"
-            
-            # Export-Formate aus Konfiguration lesen
-            export_formats = self.config['settings'].get('export_formats', ['json', 'yaml', 'txt'])
-            
-            # Export durchführen
-            export_files = self.modules['system_exporter'].export_system(
-                energy_system=self.energy_system,
-                excel_data=self.excel_data,
-                output_dir=export_dir,
-                formats=export_formats
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ System-Export erfolgreich abgeschlossen ({elapsed_time:.2f}s)")
+            with self._timed("System-Export erfolgreich abgeschlossen"):
+                # Export-Verzeichnis erstellen
+                export_dir = self.output_dir / "system_exports"
+                
+                # Export-Formate aus Konfiguration lesen
+                export_formats = self.settings.get('export_formats', ['json', 'yaml', 'txt'])
+                
+                # Export durchführen
+                export_files = self.modules['system_exporter'].export_system(
+                    energy_system=self.energy_system,
+                    excel_data=self.excel_data,
+                    output_dir=export_dir,
+                    formats=export_formats
+                )
             
             # Exportierte Dateien auflisten
-            self.logger.info(f"   📄 {len(export_files)} Export-Dateien erstellt:")
+            self.logger.info("   📄 %d Export-Dateien erstellt:", len(export_files))
             for fmt, filepath in export_files.items():
-                self.logger.info(f"      • {fmt.upper()}: {filepath.name}")
+                self.logger.info("      • %s: %s", fmt.upper(), filepath.name)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler beim System-Export: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler beim System-Export: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
@@ -266,29 +397,25 @@ class EnergySystemProject:
         self.logger.info("⚡ Schritt 3: Optimierung durchführen")
         
         try:
-            start_time = time.time()
-            
-            # Modell erstellen und optimieren
-            self.optimization_model, self.results = self.modules['optimizer'].optimize(
-                self.energy_system
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Optimierung erfolgreich abgeschlossen ({elapsed_time:.2f}s)")
+            with self._timed("Optimierung erfolgreich abgeschlossen"):
+                # Modell erstellen und optimieren
+                self.optimization_model, self.results = self.modules['optimizer'].optimize(
+                    self.energy_system
+                )
             
             # Optimierungs-Zusammenfassung
-            opt_info = self.modules['optimizer'].get_optimization_summary(
-                self.optimization_model, self.results
-            )
-            for key, value in opt_info.items():
-                self.logger.info(f"   ⚡ {key}: {value}")
+            if self.logger.isEnabledFor(logging.INFO):
+                opt_info = self.modules['optimizer'].get_optimization_summary(
+                    self.optimization_model, self.results
+                )
+                for key, value in opt_info.items():
+                    self.logger.info("   ⚡ %s: %s", key, value)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler bei der Optimierung: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler bei der Optimierung: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
@@ -297,148 +424,178 @@ class EnergySystemProject:
         self.logger.info("📈 Schritt 4: Ergebnisse verarbeiten")
         
         try:
-            start_time = time.time()
-            
-            # Ergebnisse verarbeiten und speichern
-            processed_results = self.modules['results_processor'].process_results(
-                self.results, self.energy_system, self.excel_data
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Ergebnisse erfolgreich verarbeitet ({elapsed_time:.2f}s)")
+            with self._timed("Ergebnisse erfolgreich verarbeitet"):
+                if self.settings.get('enable_cost_breakdown', True):
+                    # Ergebnisse verarbeiten und speichern
+                    processed_results = self.modules['results_processor'].process_results(
+                        self.results, self.energy_system, self.excel_data
+                    )
+                else:
+                    # Batch-Läufe: nur Flows und Zielfunktionswert, keine Excel-/Kostenauswertung
+                    processed_results = self.modules['results_processor'].process_results_minimal(
+                        self.results,
+                        self.modules['optimizer'].optimization_stats.get('objective_value')
+                    )
+                    self.logger.info("   💰 Zielfunktionswert: %s",
+                                     processed_results['objective_value'])
             
             # Gespeicherte Dateien auflisten
-            output_files = list(self.output_dir.glob("*"))
-            self.logger.info(f"   💾 {len(output_files)} Dateien erstellt:")
-            for file in sorted(output_files)[:5]:  # Nur erste 5 anzeigen
-                self.logger.info(f"      • {file.name}")
-            if len(output_files) > 5:
-                self.logger.info(f"      ... und {len(output_files) - 5} weitere")
+            if self.logger.isEnabledFor(logging.INFO):
+                output_names = os.listdir(self.output_dir)
+                self.logger.info("   💾 %d Dateien erstellt:", len(output_names))
+                for name in heapq.nsmallest(5, output_names):  # Nur erste 5 anzeigen
+                    self.logger.info("      • %s", name)
+                if len(output_names) > 5:
+                    self.logger.info("      ... und %d weitere", len(output_names) - 5)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler bei der Ergebnisverarbeitung: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler bei der Ergebnisverarbeitung: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
     def step_5_visualize(self) -> bool:
         """Schritt 5: Ergebnisse visualisieren (optional)."""
-        if not self.config['modules']['visualizer']:
+        if not self.module_config['visualizer']:
             self.logger.info("⏭️  Schritt 5: Visualisierung übersprungen (deaktiviert)")
             return True
         
         self.logger.info("📊 Schritt 5: Ergebnisse visualisieren")
         
         try:
-            start_time = time.time()
-            
-            # Visualisierungen erstellen
-            viz_files = self.modules['visualizer'].create_visualizations(
-                self.results, self.energy_system, self.excel_data
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Visualisierungen erfolgreich erstellt ({elapsed_time:.2f}s)")
+            with self._timed("Visualisierungen erfolgreich erstellt"):
+                # Visualisierungen erstellen
+                viz_files = self.modules['visualizer'].create_visualizations(
+                    self.results, self.energy_system, self.excel_data
+                )
             
             # Erstellte Visualisierungen auflisten
-            self.logger.info(f"   🎨 {len(viz_files)} Visualisierungen erstellt:")
-            for file in sorted(viz_files)[:3]:  # Nur erste 3 anzeigen
-                self.logger.info(f"      • {file.name}")
+            self.logger.info("   🎨 %d Visualisierungen erstellt:", len(viz_files))
+            for file in heapq.nsmallest(3, viz_files):  # Nur erste 3 anzeigen
+                self.logger.info("      • %s", os.path.basename(file))
             if len(viz_files) > 3:
-                self.logger.info(f"      ... und {len(viz_files) - 3} weitere")
+                self.logger.info("      ... und %d weitere", len(viz_files) - 3)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler bei der Visualisierung: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler bei der Visualisierung: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
     def step_6_analyze(self) -> bool:
         """Schritt 6: Vertiefende Analysen (optional)."""
-        if not self.config['modules']['analyzer']:
+        if not self.module_config['analyzer']:
             self.logger.info("⏭️  Schritt 6: Analysen übersprungen (deaktiviert)")
             return True
         
         self.logger.info("🔍 Schritt 6: Vertiefende Analysen")
         
         try:
-            start_time = time.time()
-            
-            # Analysen durchführen
-            analysis_files = self.modules['analyzer'].create_analysis(
-                self.results, self.energy_system, self.excel_data
-            )
-            
-            elapsed_time = time.time() - start_time
-            self.logger.info(f"✅ Analysen erfolgreich abgeschlossen ({elapsed_time:.2f}s)")
+            with self._timed("Analysen erfolgreich abgeschlossen"):
+                # Analysen durchführen
+                analysis_files = self.modules['analyzer'].create_analysis(
+                    self.results, self.energy_system, self.excel_data
+                )
             
             # Erstellte Analysen auflisten
-            self.logger.info(f"   🔍 {len(analysis_files)} Analyse-Dateien erstellt:")
-            for file in sorted(analysis_files)[:3]:  # Nur erste 3 anzeigen
-                self.logger.info(f"      • {file.name}")
+            self.logger.info("   🔍 %d Analyse-Dateien erstellt:", len(analysis_files))
+            for file in heapq.nsmallest(3, analysis_files):  # Nur erste 3 anzeigen
+                self.logger.info("      • %s", os.path.basename(file))
             if len(analysis_files) > 3:
-                self.logger.info(f"      ... und {len(analysis_files) - 3} weitere")
+                self.logger.info("      ... und %d weitere", len(analysis_files) - 3)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler bei den Analysen: {e}")
-            if self.config['settings']['debug_mode']:
-                import traceback
+            self.logger.error("❌ Fehler bei den Analysen: %s", e)
+            if self.settings['debug_mode']:
                 traceback.print_exc()
             return False
     
+    def run_postprocessing(self) -> bool:
+        """
+        Führt Schritt 5 (Visualisierung) und Schritt 6 (Analysen) aus.
+        
+        Sind beide Module aktiv, laufen die Analysen in einem Hintergrund-Thread,
+        während die Visualisierung im Hauptthread bleibt (pyplot und GUI-Backends
+        sind nicht threadsicher). Beide greifen nur lesend auf die Ergebnisse zu
+        und schreiben in getrennte Dateien. Mit 'parallel_postprocess': False
+        werden sie nacheinander ausgeführt (z.B. auf Rechnern mit wenig
+        Arbeitsspeicher).
+        """
+        both_active = self.module_config['visualizer'] and self.module_config['analyzer']
+        
+        if both_active and self.settings.get('parallel_postprocess', True):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                analysis_future = pool.submit(self.step_6_analyze)
+                
+                if not self.step_5_visualize():
+                    # Wie im sequentiellen Ablauf: nach fehlgeschlagener
+                    # Visualisierung keine Analysen (sofern noch nicht gestartet)
+                    analysis_future.cancel()
+                    return False
+                
+                return analysis_future.result()
+        
+        return self.step_5_visualize() and self.step_6_analyze()
+    
     def save_project_summary(self):
         """Speichert eine Zusammenfassung des Projekts."""
         try:
             summary_file = self.output_dir / "project_summary.txt"
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(f"PROJEKT-ZUSAMMENFASSUNG: {self.project_name}\n")
-                f.write("=" * 60 + "\n\n")
-                
-                f.write(f"Eingabedatei: {self.project_file.name}\n")
-                f.write(f"Ausführungszeit: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Output-Verzeichnis: {self.output_dir}\n\n")
-                
-                # Konfiguration
-                f.write("KONFIGURATION:\n")
-                f.write("-" * 20 + "\n")
-                for key, value in self.config['settings'].items():
-                    f.write(f"{key}: {value}\n")
-                f.write("\n")
-                
-                # Module
-                f.write("AKTIVIERTE MODULE:\n")
-                f.write("-" * 20 + "\n")
-                for module, active in self.config['modules'].items():
-                    status = "✓" if active else "✗"
-                    f.write(f"{status} {module}\n")
-                f.write("\n")
-                
-                # Dateien
-                f.write("ERSTELLTE DATEIEN:\n")
-                f.write("-" * 20 + "\n")
-                output_files = list(self.output_dir.glob('**/*'))
-                for output_file in sorted(output_files):
-                    if output_file.name != summary_file.name:
-                        f.write(f"• {output_file.name}\n")
+            lines = []
+            
+            lines.append(f"PROJEKT-ZUSAMMENFASSUNG: {self.project_name}\n{_SUMMARY_TITLE_RULE}")
             
-            self.logger.info(f"💾 Projekt-Zusammenfassung gespeichert: {summary_file.name}")
+            lines.append(
+                f"Eingabedatei: {self.project_file.name}\n"
+                f"Ausführungszeit: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+                f"Output-Verzeichnis: {self.output_dir}\n\n"
+            )
+            
+            # Konfiguration
+            if self.settings:
+                lines.append("KONFIGURATION:\n" + _SUMMARY_RULE)
+                lines.extend(f"{key}: {value}\n" for key, value in self.settings.items())
+                lines.append("\n")
+            
+            # Module
+            if self.module_config:
+                lines.append("AKTIVIERTE MODULE:\n" + _SUMMARY_RULE)
+                lines.extend(f"{'✓' if active else '✗'} {module}\n"
+                             for module, active in self.module_config.items())
+                lines.append("\n")
+            
+            # Laufzeiten
+            if self._timings:
+                lines.append("LAUFZEITEN:\n" + _SUMMARY_RULE)
+                lines.extend(f"{label}: {elapsed_time:.2f}s\n"
+                             for label, elapsed_time in self._timings.items())
+                lines.append("\n")
+            
+            # Dateien
+            output_names = sorted(_iter_output_files(self.output_dir, exclude=summary_file.name))
+            if output_names:
+                lines.append("ERSTELLTE DATEIEN:\n" + _SUMMARY_RULE)
+                lines.extend(f"• {name}\n" for name in output_names)
+            
+            # Zusammenfassung in einem Schreibvorgang speichern
+            summary_file.write_text("".join(lines), encoding='utf-8')
+            
+            self.logger.info("💾 Projekt-Zusammenfassung gespeichert: %s", summary_file.name)
             
         except Exception as e:
-            self.logger.warning(f"Projekt-Zusammenfassung konnte nicht erstellt werden: {e}")
+            self.logger.warning("Projekt-Zusammenfassung konnte nicht erstellt werden: %s", e)
     
     def run(self) -> bool:
         """Führt das komplette Projekt durch."""
         self.logger.info("🎯 Starte Projektausführung")
-        project_start_time = time.time()
+        project_start_time = time.perf_counter()
         
         # Schritt 0: Eingabedatei validieren
         if not self.validate_input_file():
@@ -464,22 +621,18 @@ class EnergySystemProject:
         if not self.step_4_process_results():
             return False
         
-        # Schritt 5: Visualisierungen erstellen (optional)
-        if not self.step_5_visualize():
-            return False
-        
-        # Schritt 6: Vertiefende Analysen (optional)
-        if not self.step_6_analyze():
+        # Schritte 5 + 6: Visualisierungen und vertiefende Analysen (optional)
+        if not self.run_postprocessing():
             return False
         
         # Projekt-Zusammenfassung speichern
         self.save_project_summary()
         
         # Gesamtzeit berechnen
-        total_time = time.time() - project_start_time
-        self.logger.info(f"🎉 Projekt erfolgreich abgeschlossen!")
-        self.logger.info(f"⏱️  Gesamtausführungszeit: {total_time:.2f} Sekunden")
-        self.logger.info(f"📁 Ergebnisse verfügbar in: {self.output_dir}")
+        total_time = time.perf_counter() - project_start_time
+        self.logger.info("🎉 Projekt erfolgreich abgeschlossen!")
+        self.logger.info("⏱️  Gesamtausführungszeit: %.2f Sekunden", total_time)
+        self.logger.info("📁 Ergebnisse verfügbar in: %s", self.output_dir)
         
         return True
 
@@ -498,7 +651,11 @@ def main_program(project_file: Path, config: Dict[str, Any]) -> bool:
     try:
         # Projekt initialisieren und ausführen
         project = EnergySystemProject(project_file, config)
-        return project.run()
+        try:
+            return project.run()
+        finally:
+            # Gepufferte Konsolen-Ausgabe vor der Rückkehr ins Menü ausgeben
+            project._console_buffer.flush()
         
     except KeyboardInterrupt:
         print("\n⚠️  Ausführung durch Benutzer unterbrochen")
@@ -507,7 +664,6 @@ def main_program(project_file: Path, config: Dict[str, Any]) -> bool:
     except Exception as e:
         print(f"❌ Unerwarteter Fehler: {e}")
         if config.get('settings', {}).get('debug_mode', False):
-            import traceback
             traceback.print_exc()
         return False
 
@@ -517,6 +673,10 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         project_file = Path(sys.argv[1])
         
+        if not project_file.exists():
+            print(f"❌ Projektdatei nicht gefunden: {project_file}")
+            sys.exit(1)
+        
         # Standard-Konfiguration für Testausführung
         test_config = {
             'modules': {
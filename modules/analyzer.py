@@ -17,6 +17,9 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+# Schreibpuffer für Exporte mit vielen kleinen write()-Aufrufen (json.dump, Text-Report)
+_WRITE_BUFFER_SIZE = 128 * 1024
+
 
 class Analyzer:
     """Klasse für vertiefende Analysen von Optimierungsergebnissen."""
@@ -369,7 +372,7 @@ class Analyzer:
             import json
             
             json_file = self.output_dir / "analysis_results.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
+            with open(json_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(self.analysis_results, f, indent=2, default=str)
             
             self.output_files.append(json_file)
@@ -395,7 +398,7 @@ class Analyzer:
             
             # Text-Report
             report_file = self.output_dir / "analysis_report.txt"
-            with open(report_file, 'w', encoding='utf-8') as f:
+            with open(report_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 f.write("VERTIEFENDE ANALYSE - BERICHT\n")
                 f.write("=" * 50 + "\n\n")
                 
@@ -404,7 +407,7 @@ class Analyzer:
                     f.write("-" * 30 + "\n")
                     
                     if isinstance(results, dict):
-                        self._write_dict_to_file(f, results, indent=0)
+                        f.writelines(self._iter_dict_lines(results, indent=0))
                     else:
                         f.write(f"{results}\n")
                     
@@ -427,14 +430,15 @@ class Analyzer:
                 items.append((new_key, v))
         return dict(items)
     
-    def _write_dict_to_file(self, f, d: Dict, indent: int = 0):
-        """Schreibt Dictionary strukturiert in Datei."""
+    def _iter_dict_lines(self, d: Dict, indent: int = 0):
+        """Liefert die Zeilen eines strukturiert formatierten Dictionaries (für writelines)."""
+        prefix = "  " * indent
         for key, value in d.items():
             if isinstance(value, dict):
-                f.write("  " * indent + f"{key}:\n")
-                self._write_dict_to_file(f, value, indent + 1)
+                yield f"{prefix}{key}:\n"
+                yield from self._iter_dict_lines(value, indent + 1)
             else:
-                f.write("  " * indent + f"{key}: {value}\n")
+                yield f"{prefix}{key}: {value}\n"
 
 
 def test_analyzer():
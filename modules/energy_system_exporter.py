@@ -24,6 +24,9 @@ import oemof.solph as solph
 from oemof.solph import Investment, NonConvex
 import logging
 
+# Schreibpuffer für Exporte mit vielen kleinen write()-Aufrufen (json.dump, yaml.dump)
+_WRITE_BUFFER_SIZE = 128 * 1024
+
 
 class EnergySystemExporter:
     """
@@ -482,13 +485,13 @@ class EnergySystemExporter:
         filepath = output_dir / "energy_system_export.json"
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         except Exception as e:
             self.logger.error(f"JSON Export Fehler: {e}")
             # Fallback: Vereinfachte Version ohne problematische Werte
             simplified_data = self._simplify_for_json(data)
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(simplified_data, f, indent=2, ensure_ascii=False, default=str)
         
         self.logger.debug(f"JSON Export: {filepath}")
@@ -569,7 +572,7 @@ class EnergySystemExporter:
         
         # Debug-Datei speichern
         debug_filepath = output_dir / "energy_system_debug_analysis.json"
-        with open(debug_filepath, 'w', encoding='utf-8') as f:
+        with open(debug_filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             json.dump(debug_info, f, indent=2, ensure_ascii=False, default=str)
         
         self.logger.info(f"🔍 Debug-Analyse erstellt: {debug_filepath}")
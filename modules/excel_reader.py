@@ -11,12 +11,18 @@ Datum: Juli 2025
 Version: 2.1.0 (Fixed)
 """
 
+import os
+import pickle
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 import logging
 
+# Version des Cache-Formats; erhöhen, sobald sich process_excel_data oder
+# das Format der verarbeiteten Daten ändert (alte Caches werden dann verworfen)
+_CACHE_VERSION = 1
+
 
 class ExcelReader:
     """
@@ -37,6 +43,7 @@ class ExcelReader:
         # Konfiguration
         self.bus_separator = settings.get('bus_separator', '|')
         self.factor_separator = settings.get('factor_separator', '|')
+        self.use_cache = settings.get('excel_cache', True)
         
         # Erweiterte Spalten-Definitionen
         self.required_columns = self._get_required_columns()
@@ -65,6 +72,14 @@ class ExcelReader:
         Returns:
             Dictionary mit verarbeiteten Daten
         """
+        cache_file = self._get_cache_file(excel_file)
+        if self.use_cache:
+            # Quell-Signatur vor dem Lesen bestimmen (Änderung während des Lesens → kein Treffer)
+            source_signature = self._source_signature(excel_file)
+            cached_data = self._load_cached_data(cache_file, source_signature)
+            if cached_data is not None:
+                return cached_data
+        
         self.logger.info(f"📖 Lade Excel-Datei: {excel_file.name}")
         
         try:
@@ -87,12 +102,82 @@ class ExcelReader:
             self._validate_processed_data(processed_data)
             
             self.logger.info("✅ Excel-Daten erfolgreich verarbeitet")
+            
+            if self.use_cache:
+                self._write_cache(cache_file, source_signature, processed_data)
+            
             return processed_data
             
         except Exception as e:
             self.logger.error(f"❌ Fehler beim Verarbeiten der Excel-Datei: {e}")
             raise
     
+    def _get_cache_file(self, excel_file: Path) -> Path:
+        """Pfad der Cache-Datei für eine Excel-Datei (<verzeichnis>/.cache/<name>.pkl)."""
+        return excel_file.parent / ".cache" / f"{excel_file.stem}.pkl"
+    
+    def _cache_key(self) -> tuple:
+        """Cache-Format-Version und Einstellungen, die das Verarbeitungsergebnis beeinflussen."""
+        return (_CACHE_VERSION, self.bus_separator, self.factor_separator)
+    
+    def _source_signature(self, excel_file: Path) -> tuple:
+        """Größe und Änderungszeit (ns) der Excel-Datei für den exakten Cache-Abgleich."""
+        stat_result = excel_file.stat()
+        return (stat_result.st_size, stat_result.st_mtime_ns)
+    
+    def _load_cached_data(self, cache_file: Path, source_signature: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Lädt verarbeitete Daten aus dem Cache, falls dieser aktuell ist.
+        
+        Der Cache gilt nur, wenn er mit derselben Cache-Version und denselben
+        Separator-Einstellungen erzeugt wurde und Größe und Änderungszeit der
+        Excel-Datei exakt übereinstimmen (auch ältere Kopien werden erkannt).
+        
+        Sicherheitshinweis: Der Cache wird per pickle geladen und darf daher nur
+        von diesem Tool selbst geschrieben worden sein. Cache-Dateien, die nicht
+        dem aktuellen Benutzer gehören, werden ignoriert; .cache/-Verzeichnisse
+        aus fremden Quellen (z.B. weitergegebene Projektordner) sollten gelöscht
+        werden.
+        
+        Args:
+            cache_file: Pfad zur Cache-Datei
+            source_signature: Ergebnis von _source_signature() für die Excel-Datei
+            
+        Returns:
+            Verarbeitete Daten oder None
+        """
+        try:
+            if hasattr(os, 'getuid') and cache_file.stat().st_uid != os.getuid():
+                self.logger.warning(f"⚠️  Excel-Cache gehört einem anderen Benutzer, wird ignoriert: {cache_file}")
+                return None
+            
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            
+            if cached.get('key') != self._cache_key() or cached.get('source') != source_signature:
+                return None
+            
+            self.logger.info(f"⚡ Lade Excel-Daten aus Cache: {cache_file.name}")
+            return cached['data']
+            
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Cache nicht lesbar, lese Excel-Datei neu: {e}")
+            return None
+    
+    def _write_cache(self, cache_file: Path, source_signature: tuple,
+                     processed_data: Dict[str, Any]) -> None:
+        """Schreibt verarbeitete Daten in den Cache (Fehler werden nur protokolliert)."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump({'key': self._cache_key(), 'source': source_signature,
+                             'data': processed_data}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(f"⚠️  Excel-Cache konnte nicht geschrieben werden: {e}")
+    
     def get_data_summary(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
         """
         Erstellt eine Zusammenfassung der verarbeiteten Daten.
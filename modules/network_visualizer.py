@@ -23,6 +23,7 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Set
 import logging
+import re
 import textwrap
 
 # Basis-Imports (sollten immer verfügbar sein)
@@ -50,6 +51,64 @@ except ImportError:
     solph = None
 
 
+def _label_patterns(*groups: Tuple[str, List[str]]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Kompiliert Schlüsselwort-Gruppen zu (Ergebnis, Regex)-Paaren (Reihenfolge = Priorität)."""
+    return tuple((result, re.compile('|'.join(map(re.escape, words)))) for result, words in groups)
+
+
+def _classify_label(label: str, patterns: Tuple[Tuple[str, re.Pattern], ...],
+                    default: Optional[str] = None) -> Optional[str]:
+    """Gibt das Ergebnis des ersten Musters zurück, das im Label vorkommt."""
+    for result, pattern in patterns:
+        if pattern.search(label):
+            return result
+    return default
+
+
+# Label-Klassifikation (Teilstring-Suche in Kleinbuchstaben)
+_SOURCE_PROPERTY_PATTERNS = _label_patterns(
+    ('renewable', ['pv', 'solar', 'wind', 'hydro']),
+    ('grid_connection', ['grid', 'import']),
+    ('fossil', ['gas', 'coal', 'fossil']),
+)
+_SINK_LOAD_TYPE_PATTERNS = _label_patterns(
+    ('demand', ['load', 'demand', 'last']),
+    ('export', ['export', 'grid']),
+)
+_CONVERTER_TYPE_PATTERNS = _label_patterns(
+    ('chp', ['chp', 'kwk']),
+    ('heat_pump', ['heat_pump', 'hp', 'wärmepumpe']),
+    ('boiler', ['boiler', 'kessel']),
+    ('power_plant', ['gas', 'power']),
+)
+_BUS_TYPE_PATTERNS = _label_patterns(
+    ('electrical', ['el', 'electric', 'power', 'strom']),
+    ('thermal', ['heat', 'thermal', 'wärme', 'therm']),
+    ('gas', ['gas', 'fuel', 'brennstoff']),
+    ('h2', ['h2', 'hydrogen', 'wasserstoff']),
+)
+_NODE_COLOR_PATTERNS = {
+    'source': _label_patterns(
+        ('source_renewable', ['pv', 'solar', 'wind', 'hydro', 'renewable']),
+        ('source_grid', ['grid', 'import', 'netz']),
+        ('source_fossil', ['gas', 'coal', 'oil', 'fossil']),
+    ),
+    'sink': _label_patterns(
+        ('sink_load', ['load', 'demand', 'last', 'verbrauch']),
+        ('sink_export', ['export', 'grid', 'einspeisung']),
+    ),
+    'converter': _label_patterns(
+        ('converter_chp', ['chp', 'kwk', 'bhkw']),
+        ('converter_hp', ['heat_pump', 'hp', 'wärmepumpe', 'wp']),
+        ('converter_boiler', ['boiler', 'kessel']),
+    ),
+    'storage': _label_patterns(
+        ('storage_battery', ['battery', 'batterie', 'akku']),
+        ('storage_thermal', ['thermal', 'heat', 'wärme']),
+    ),
+}
+
+
 class EnergySystemNetworkVisualizer:
     """Erstellt detaillierte Netzwerk-Visualisierungen von oemof.solph EnergySystem-Objekten."""
     
@@ -237,12 +296,9 @@ class EnergySystemNetworkVisualizer:
         
         # Renewable detection basierend auf Label
         label = str(source.label).lower()
-        if any(word in label for word in ['pv', 'solar', 'wind', 'hydro']):
-            properties['renewable'] = True
-        elif any(word in label for word in ['grid', 'import']):
-            properties['grid_connection'] = True
-        elif any(word in label for word in ['gas', 'coal', 'fossil']):
-            properties['fossil'] = True
+        source_property = _classify_label(label, _SOURCE_PROPERTY_PATTERNS)
+        if source_property:
+            properties[source_property] = True
         
         return properties
     
@@ -252,10 +308,9 @@ class EnergySystemNetworkVisualizer:
         
         # Load vs Export detection
         label = str(sink.label).lower()
-        if any(word in label for word in ['load', 'demand', 'last']):
-            properties['load_type'] = 'demand'
-        elif any(word in label for word in ['export', 'grid']):
-            properties['load_type'] = 'export'
+        load_type = _classify_label(label, _SINK_LOAD_TYPE_PATTERNS)
+        if load_type:
+            properties['load_type'] = load_type
         
         return properties
     
@@ -265,14 +320,9 @@ class EnergySystemNetworkVisualizer:
         
         # Converter type detection
         label = str(converter.label).lower()
-        if any(word in label for word in ['chp', 'kwk']):
-            properties['converter_type'] = 'chp'
-        elif any(word in label for word in ['heat_pump', 'hp', 'wärmepumpe']):
-            properties['converter_type'] = 'heat_pump'
-        elif any(word in label for word in ['boiler', 'kessel']):
-            properties['converter_type'] = 'boiler'
-        elif any(word in label for word in ['gas', 'power']):
-            properties['converter_type'] = 'power_plant'
+        converter_type = _classify_label(label, _CONVERTER_TYPE_PATTERNS)
+        if converter_type:
+            properties['converter_type'] = converter_type
         
         # Conversion factors (falls verfügbar)
         if hasattr(converter, 'conversion_factors'):
@@ -320,17 +370,7 @@ class EnergySystemNetworkVisualizer:
     def _detect_bus_type(self, bus) -> str:
         """Erkennt den Typ eines Buses basierend auf dem Label."""
         label = str(bus.label).lower()
-        
-        if any(word in label for word in ['el', 'electric', 'power', 'strom']):
-            return 'electrical'
-        elif any(word in label for word in ['heat', 'thermal', 'wärme', 'therm']):
-            return 'thermal'
-        elif any(word in label for word in ['gas', 'fuel', 'brennstoff']):
-            return 'gas'
-        elif any(word in label for word in ['h2', 'hydrogen', 'wasserstoff']):
-            return 'h2'
-        else:
-            return 'generic'
+        return _classify_label(label, _BUS_TYPE_PATTERNS, 'generic')
     
     def _get_node_color(self, node) -> str:
         """Bestimmt die Farbe eines Nodes."""
@@ -341,41 +381,9 @@ class EnergySystemNetworkVisualizer:
             bus_type = self._detect_bus_type(node)
             return self.component_colors.get(f'bus_{bus_type}', self.component_colors['bus'])
         
-        elif category == 'source':
-            if any(word in label for word in ['pv', 'solar', 'wind', 'hydro', 'renewable']):
-                return self.component_colors['source_renewable']
-            elif any(word in label for word in ['grid', 'import', 'netz']):
-                return self.component_colors['source_grid']
-            elif any(word in label for word in ['gas', 'coal', 'oil', 'fossil']):
-                return self.component_colors['source_fossil']
-            else:
-                return self.component_colors['source']
-        
-        elif category == 'sink':
-            if any(word in label for word in ['load', 'demand', 'last', 'verbrauch']):
-                return self.component_colors['sink_load']
-            elif any(word in label for word in ['export', 'grid', 'einspeisung']):
-                return self.component_colors['sink_export']
-            else:
-                return self.component_colors['sink']
-        
-        elif category == 'converter':
-            if any(word in label for word in ['chp', 'kwk', 'bhkw']):
-                return self.component_colors['converter_chp']
-            elif any(word in label for word in ['heat_pump', 'hp', 'wärmepumpe', 'wp']):
-                return self.component_colors['converter_hp']
-            elif any(word in label for word in ['boiler', 'kessel']):
-                return self.component_colors['converter_boiler']
-            else:
-                return self.component_colors['converter']
-        
-        elif category == 'storage':
-            if any(word in label for word in ['battery', 'batterie', 'akku']):
-                return self.component_colors['storage_battery']
-            elif any(word in label for word in ['thermal', 'heat', 'wärme']):
-                return self.component_colors['storage_thermal']
-            else:
-                return self.component_colors['storage']
+        elif category in _NODE_COLOR_PATTERNS:
+            color_key = _classify_label(label, _NODE_COLOR_PATTERNS[category], category)
+            return self.component_colors[color_key]
         
         else:
             return '#DDDDDD'  # Grau für unbekannte Typen
@@ -415,34 +423,35 @@ class EnergySystemNetworkVisualizer:
             'properties': {},
             'style': 'normal'
         }
+        properties = flow_info['properties']
         
         try:
             # Nominal Capacity
             if hasattr(flow, 'nominal_capacity') and flow.nominal_capacity is not None:
                 if isinstance(flow.nominal_capacity, Investment):
-                    flow_info['properties']['investment'] = self._analyze_investment(flow.nominal_capacity)
+                    properties['investment'] = self._analyze_investment(flow.nominal_capacity)
                     flow_info['style'] = 'investment'
                 elif isinstance(flow.nominal_capacity, (int, float)):
-                    flow_info['properties']['nominal_capacity'] = flow.nominal_capacity
+                    properties['nominal_capacity'] = flow.nominal_capacity
             
             # Variable Costs
             if hasattr(flow, 'variable_costs') and flow.variable_costs is not None:
-                flow_info['properties']['variable_costs'] = flow.variable_costs
+                properties['variable_costs'] = flow.variable_costs
             
             # Min/Max
             if hasattr(flow, 'min') and flow.min is not None:
-                flow_info['properties']['min'] = flow.min
+                properties['min'] = flow.min
             
             if hasattr(flow, 'max') and flow.max is not None:
-                flow_info['properties']['max'] = flow.max
+                properties['max'] = flow.max
             
             # Fix
             if hasattr(flow, 'fix') and flow.fix is not None:
-                flow_info['properties']['fix'] = "Profile (fix)"
+                properties['fix'] = "Profile (fix)"
             
             # NonConvex
             if hasattr(flow, 'nonconvex') and flow.nonconvex is not None:
-                flow_info['properties']['nonconvex'] = self._analyze_nonconvex(flow.nonconvex)
+                properties['nonconvex'] = self._analyze_nonconvex(flow.nonconvex)
                 flow_info['style'] = 'nonconvex'
                 
         except Exception as e:
@@ -890,94 +899,107 @@ class EnergySystemNetworkVisualizer:
         
         analysis_file = self.output_dir / f"{filename}_analysis.txt"
         
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            f.write("OEMOF.SOLPH ENERGY SYSTEM ANALYSIS\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Zeitindex-Info
-            if analysis['timeindex_info']:
-                f.write("SIMULATION TIMEFRAME:\n")
-                f.write("-" * 25 + "\n")
-                info = analysis['timeindex_info']
-                f.write(f"Start: {info['start']}\n")
-                f.write(f"End: {info['end']}\n")
-                f.write(f"Periods: {info['periods']}\n")
-                f.write(f"Frequency: {info['freq']}\n")
-                f.write(f"Total Hours: {info['total_hours']}\n\n")
-            
-            # System-Statistiken
-            f.write("SYSTEM STATISTICS:\n")
-            f.write("-" * 20 + "\n")
-            stats = analysis['statistics']
-            f.write(f"Total Nodes: {stats['total_nodes']}\n")
-            f.write(f"Total Connections: {stats['total_edges']}\n")
-            f.write(f"Investment Options: {stats['total_investments']}\n")
-            f.write(f"NonConvex Components: {stats['total_nonconvex']}\n")
-            f.write(f"Complexity Score: {stats['complexity_score']:.1f}\n\n")
-            
-            # Node-Typen
-            f.write("NODE TYPES:\n")
-            f.write("-" * 12 + "\n")
-            for node_type, count in stats['node_types'].items():
-                f.write(f"{node_type.title()}: {count}\n")
-            f.write("\n")
-            
-            # Detaillierte Node-Analyse
-            f.write("DETAILED NODE ANALYSIS:\n")
-            f.write("-" * 25 + "\n")
+        parts = []
+        
+        parts.append("OEMOF.SOLPH ENERGY SYSTEM ANALYSIS\n")
+        parts.append("=" * 50 + "\n\n")
+        
+        # Zeitindex-Info
+        if analysis['timeindex_info']:
+            parts.append("SIMULATION TIMEFRAME:\n")
+            parts.append("-" * 25 + "\n")
+            info = analysis['timeindex_info']
+            parts.append(
+                f"Start: {info['start']}\n"
+                f"End: {info['end']}\n"
+                f"Periods: {info['periods']}\n"
+                f"Frequency: {info['freq']}\n"
+                f"Total Hours: {info['total_hours']}\n\n"
+            )
+        
+        # System-Statistiken
+        parts.append("SYSTEM STATISTICS:\n")
+        parts.append("-" * 20 + "\n")
+        stats = analysis['statistics']
+        parts.append(
+            f"Total Nodes: {stats['total_nodes']}\n"
+            f"Total Connections: {stats['total_edges']}\n"
+            f"Investment Options: {stats['total_investments']}\n"
+            f"NonConvex Components: {stats['total_nonconvex']}\n"
+            f"Complexity Score: {stats['complexity_score']:.1f}\n\n"
+        )
+        
+        # Node-Typen
+        parts.append("NODE TYPES:\n")
+        parts.append("-" * 12 + "\n")
+        for node_type, count in stats['node_types'].items():
+            parts.append(f"{node_type.title()}: {count}\n")
+        parts.append("\n")
+        
+        # Detaillierte Node-Analyse
+        parts.append("DETAILED NODE ANALYSIS:\n")
+        parts.append("-" * 25 + "\n")
+        
+        for node_label, node_info in analysis['nodes'].items():
+            parts.append(f"{node_label} ({node_info['type']}):\n")
+            node_properties = node_info['properties']
+            inputs = node_info['flows']['inputs']
+            outputs = node_info['flows']['outputs']
+            
+            # Eigenschaften
+            if node_properties:
+                parts.append("  Properties:\n")
+                for prop, value in node_properties.items():
+                    parts.append(f"    {prop}: {value}\n")
+            
+            # Input Flows
+            if inputs:
+                parts.append("  Input Flows:\n")
+                for flow in inputs:
+                    flow_properties = flow['properties']
+                    if flow_properties:
+                        props = ', '.join(f"{k}={v}" for k, v in flow_properties.items())
+                        parts.append(f"    ← {flow['source']} ({props})\n")
+                    else:
+                        parts.append(f"    ← {flow['source']}\n")
+            
+            # Output Flows  
+            if outputs:
+                parts.append("  Output Flows:\n")
+                for flow in outputs:
+                    flow_properties = flow['properties']
+                    if flow_properties:
+                        props = ', '.join(f"{k}={v}" for k, v in flow_properties.items())
+                        parts.append(f"    → {flow['target']} ({props})\n")
+                    else:
+                        parts.append(f"    → {flow['target']}\n")
+            
+            parts.append("\n")
+        
+        # Investment-Details
+        if analysis['investments']:
+            parts.append("INVESTMENT DETAILS:\n")
+            parts.append("-" * 20 + "\n")
             
-            for node_label, node_info in analysis['nodes'].items():
-                f.write(f"{node_label} ({node_info['type']}):\n")
-                
-                # Eigenschaften
-                if node_info['properties']:
-                    f.write("  Properties:\n")
-                    for prop, value in node_info['properties'].items():
-                        f.write(f"    {prop}: {value}\n")
-                
-                # Input Flows
-                if node_info['flows']['inputs']:
-                    f.write("  Input Flows:\n")
-                    for flow in node_info['flows']['inputs']:
-                        f.write(f"    ← {flow['source']}")
-                        if flow['properties']:
-                            props = [f"{k}={v}" for k, v in flow['properties'].items()]
-                            f.write(f" ({', '.join(props)})")
-                        f.write("\n")
-                
-                # Output Flows  
-                if node_info['flows']['outputs']:
-                    f.write("  Output Flows:\n")
-                    for flow in node_info['flows']['outputs']:
-                        f.write(f"    → {flow['target']}")
-                        if flow['properties']:
-                            props = [f"{k}={v}" for k, v in flow['properties'].items()]
-                            f.write(f" ({', '.join(props)})")
-                        f.write("\n")
-                
-                f.write("\n")
+            for inv in analysis['investments']:
+                parts.append(f"{inv['connection']}:\n")
+                for param, value in inv['investment'].items():
+                    parts.append(f"  {param}: {value}\n")
+                parts.append("\n")
+        
+        # NonConvex-Details
+        if analysis['nonconvex']:
+            parts.append("NONCONVEX DETAILS:\n")
+            parts.append("-" * 18 + "\n")
             
-            # Investment-Details
-            if analysis['investments']:
-                f.write("INVESTMENT DETAILS:\n")
-                f.write("-" * 20 + "\n")
-                
-                for inv in analysis['investments']:
-                    f.write(f"{inv['connection']}:\n")
-                    for param, value in inv['investment'].items():
-                        f.write(f"  {param}: {value}\n")
-                    f.write("\n")
-            
-            # NonConvex-Details
-            if analysis['nonconvex']:
-                f.write("NONCONVEX DETAILS:\n")
-                f.write("-" * 18 + "\n")
-                
-                for nc in analysis['nonconvex']:
-                    f.write(f"{nc['connection']}:\n")
-                    for param, value in nc['nonconvex'].items():
-                        f.write(f"  {param}: {value}\n")
-                    f.write("\n")
+            for nc in analysis['nonconvex']:
+                parts.append(f"{nc['connection']}:\n")
+                for param, value in nc['nonconvex'].items():
+                    parts.append(f"  {param}: {value}\n")
+                parts.append("\n")
+        
+        # Analyse in einem Schreibvorgang speichern
+        analysis_file.write_text("".join(parts), encoding='utf-8')
         
         self.logger.debug(f"      📋 {analysis_file.name}")
     
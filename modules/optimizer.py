@@ -30,6 +30,9 @@ except ImportError as e:
 class Optimizer:
     """Klasse für die Optimierung von oemof.solph Energiesystemen."""
     
+    # Solver, deren Pyomo-Schnittstelle einen Warmstart (MIP-Start) unterstützt
+    WARMSTART_SOLVERS = ('cbc', 'gurobi', 'cplex')
+    
     def __init__(self, settings: Dict[str, Any]):
         """
         Initialisiert den Optimizer.
@@ -47,6 +50,42 @@ class Optimizer:
         # Optimierungs-Statistiken
         self.optimization_stats = {}
     
+    def _get_cmdline_options(self) -> Dict[str, Any]:
+        """
+        Übersetzt die Solver-Parameter aus den Settings in Kommandozeilen-Optionen.
+        
+        Threads, MIP-Gap und Zeitlimit haben je Solver eigene Optionsnamen;
+        Solver ohne passende Option (z.B. GLPK ohne Threads) ignorieren den Wert.
+        Nicht gesetzte Parameter (None) werden nicht übergeben, damit der Solver
+        mit seinen eigenen Standardwerten rechnet.
+        
+        Returns:
+            Dictionary für oemof.solph Model.solve(cmdline_options=...)
+        """
+        threads = self.settings.get('solver_threads')
+        mip_gap = self.settings.get('solver_mip_gap')
+        time_limit = self.settings.get('solver_time_limit')
+        solver = self.solver_name.lower()
+        
+        if solver == 'cbc':
+            names = {'threads': 'threads', 'gap': 'ratioGap', 'time': 'sec'}
+        elif solver == 'gurobi':
+            names = {'threads': 'Threads', 'gap': 'MIPGap', 'time': 'TimeLimit'}
+        elif solver == 'glpk':
+            names = {'gap': 'mipgap', 'time': 'tmlim'}
+        else:
+            return {}
+        
+        options = {}
+        if threads and 'threads' in names:
+            options[names['threads']] = threads
+        if mip_gap is not None:
+            options[names['gap']] = mip_gap
+        if time_limit:
+            options[names['time']] = time_limit
+        
+        return options
+    
     def _get_solver_options(self) -> Dict[str, Any]:
         """Gibt solver-spezifische Optionen zurück."""
         if self.solver_name.lower() == 'cbc':
@@ -114,10 +153,18 @@ class Optimizer:
                 solve_kwargs = {
                     'tee': self.settings.get('debug_mode', False)
                 }
+                # Warmstart aus vorhandenen Variablenwerten (nur MIP-Solver mit Unterstützung)
+                if (self.settings.get('solver_warmstart', False)
+                        and self.solver_name.lower() in self.WARMSTART_SOLVERS):
+                    solve_kwargs['warmstart'] = True
+                cmdline_options = self._get_cmdline_options()
+                if cmdline_options:
+                    self.logger.info("   🔧 Solver-Parameter: %s", cmdline_options)
                 
                 optimization_model.solve(
                     solver=self.solver_name,
-                    solve_kwargs=solve_kwargs
+                    solve_kwargs=solve_kwargs,
+                    cmdline_options=cmdline_options
                 )
                 
             except Exception as solve_error:
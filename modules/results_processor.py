@@ -23,6 +23,7 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import sys
 
 
 class ResultsProcessor:
@@ -107,6 +108,28 @@ class ResultsProcessor:
         
         return processed_results
     
+    def process_results_minimal(self, results: Dict[str, Any], 
+                               objective_value: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Minimale Ergebnisverarbeitung ohne Kosten-Analyse und Excel-Ausgabe.
+        
+        Für Batch-Läufe (z.B. Parameterstudien), bei denen nur der
+        Zielfunktionswert benötigt wird.
+        
+        Args:
+            results: oemof.solph Optimierungsergebnisse
+            objective_value: Zielfunktionswert aus dem Optimizer
+            
+        Returns:
+            Dictionary mit Flows und Zielfunktionswert
+        """
+        self.logger.info("📈 Verarbeite Optimierungsergebnisse (minimal)...")
+        
+        return {
+            'flows': self._extract_flows(results),
+            'objective_value': objective_value
+        }
+    
     def _extract_flows(self, results: Dict[str, Any]) -> pd.DataFrame:
         """
         Extrahiert alle Flows mit Ursprung und Ziel.
@@ -660,13 +683,17 @@ def test_results_processor():
         try:
             results = processor.process_results(dummy_results, energy_system, {})
             
-            print("✅ Results Processor Test erfolgreich!")
-            print(f"   📊 Flows: {len(results['flows'])} Einträge")
-            print(f"   🔋 Kapazitäten: {len(results['capacities'])} Einträge")
-            print(f"   ⚡ Erzeugung: {len(results['generation'])} Einträge")
-            print(f"   ⏱️ Vollbenutzung: {len(results['utilization'])} Einträge")
-            print(f"   💰 Kosten-Analyse: {results['cost_analysis']['cost_summary']['total_costs']:.2f} €")
-            print(f"   📄 Excel-Datei: {results['excel_file'].name}")
+            # Zusammenfassung gesammelt in einem write ausgeben
+            lines = [
+                "✅ Results Processor Test erfolgreich!",
+                f"   📊 Flows: {len(results['flows'])} Einträge",
+                f"   🔋 Kapazitäten: {len(results['capacities'])} Einträge",
+                f"   ⚡ Erzeugung: {len(results['generation'])} Einträge",
+                f"   ⏱️ Vollbenutzung: {len(results['utilization'])} Einträge",
+                f"   💰 Kosten-Analyse: {results['cost_analysis']['cost_summary']['total_costs']:.2f} €",
+                f"   📄 Excel-Datei: {results['excel_file'].name}",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             print(f"❌ Test fehlgeschlagen: {e}")
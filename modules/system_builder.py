@@ -11,21 +11,70 @@ Datum: Juli 2025
 Version: 2.0.0 (Multi-IO)
 """
 
+import functools
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 import logging
 
-# oemof.solph 0.6.0 Imports
-try:
+if TYPE_CHECKING:
+    # Nur für Typannotationen; zur Laufzeit wird oemof.solph lazy über _load_solph() geladen
     import oemof.solph as solph
-    from oemof.solph import buses, components
-    from oemof.solph._options import Investment, NonConvex
-    Flow = solph.Flow
-except ImportError as e:
-    print(f"❌ oemof.solph nicht verfügbar: {e}")
-    print("Installieren Sie oemof.solph: pip install oemof.solph>=0.6.0")
-    raise
+
+# Komponenten-Sheets, die der Builder verarbeitet
+_COMPONENT_SHEETS = ('buses', 'sources', 'sinks', 'simple_transformers')
+
+# Platzhalter für fehlende Zeitreihen (wird nur gelesen, nie verändert)
+_EMPTY_TIMESERIES = pd.DataFrame()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_solph():
+    """
+    Importiert oemof.solph 0.6.0 beim ersten Gebrauch.
+    
+    Der Import kostet mehrere hundert Millisekunden und wird erst benötigt,
+    wenn tatsächlich ein Energiesystem aufgebaut wird.
+    
+    Returns:
+        Das Modul oemof.solph
+    """
+    try:
+        import oemof.solph as solph
+    except ImportError as e:
+        print(f"❌ oemof.solph nicht verfügbar: {e}")
+        print("Installieren Sie oemof.solph: pip install oemof.solph>=0.6.0")
+        raise
+    
+    return solph
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_bus_string(bus_str: str, separator: str) -> Tuple[str, ...]:
+    """
+    Zerlegt einen Bus-String in die einzelnen Bus-Namen.
+    
+    Komponenten referenzieren meist dieselben wenigen Bus-Strings, daher wird
+    das Ergebnis pro Wert gecacht (unveränderliches Tuple).
+    
+    Args:
+        bus_str: "el_bus|heat_bus" oder "el_bus" (bereits gestrippt)
+        separator: Trennzeichen
+        
+    Returns:
+        Tuple der Bus-Namen ohne leere Einträge
+    """
+    if separator in bus_str:
+        return tuple(bus for bus in (part.strip() for part in bus_str.split(separator)) if bus)
+    
+    return (bus_str,) if bus_str else ()
+
+
+def __getattr__(name: str):
+    """Stellt ``solph`` als Modulattribut lazy bereit (z.B. system_builder.solph)."""
+    if name == 'solph':
+        return _load_solph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MultiIOSystemBuilder:
@@ -47,11 +96,26 @@ class MultiIOSystemBuilder:
         self.bus_separator = settings.get('bus_separator', '|')
         self.factor_separator = settings.get('factor_separator', '|')
         
+        # Trennzeichen einmalig prüfen statt erst beim Parsen jeder Zeile zu scheitern
+        for key, separator in (('bus_separator', self.bus_separator),
+                               ('factor_separator', self.factor_separator)):
+            if not isinstance(separator, str) or not separator:
+                raise ValueError(f"Ungültiges Trennzeichen für '{key}': {separator!r}")
+        
         # Komponenten-Container
         self.bus_objects = {}
         self.component_objects = {}
         self.energy_system = None
         
+        # Bus-Verbindungen (Label → Anzahl Flows je Richtung), beim Aufbau gezählt
+        self.bus_connections = {}
+        
+        # Beim Aufbau vorhandene, nicht-leere Komponenten-Sheets
+        self._available_sheets = frozenset()
+        
+        # Bei der Validierung geparste Conversion-Faktoren (Label → Faktoren)
+        self._parsed_factors = {}
+        
         # Statistiken
         self.build_stats = {
             'buses': 0,
@@ -64,7 +128,7 @@ class MultiIOSystemBuilder:
             'timeseries': 0
         }
     
-    def build_energy_system(self, excel_data: Dict[str, Any]) -> solph.EnergySystem:
+    def build_energy_system(self, excel_data: Dict[str, Any]) -> 'solph.EnergySystem':
         """
         Baut das komplette Energiesystem mit Multi-IO-Unterstützung auf.
         
@@ -74,8 +138,16 @@ class MultiIOSystemBuilder:
         Returns:
             Vollständiges oemof.solph EnergySystem
         """
+        solph = _load_solph()
+        
         self.logger.info("🏗️ Beginne Energiesystem-Aufbau (Multi-IO)")
         
+        # Vorhandene, nicht-leere Komponenten-Sheets einmalig bestimmen
+        self._available_sheets = frozenset(
+            name for name in _COMPONENT_SHEETS
+            if isinstance(excel_data.get(name), pd.DataFrame) and not excel_data[name].empty
+        )
+        
         # Zeitindex erstellen
         timeindex = self._create_timeindex(excel_data.get('settings', {}))
         
@@ -89,8 +161,7 @@ class MultiIOSystemBuilder:
         self._build_multi_transformers(excel_data)  # Neue Multi-IO-Transformer
         
         # Alle Objekte zum EnergySystem hinzufügen
-        all_objects = list(self.bus_objects.values()) + list(self.component_objects.values())
-        self.energy_system.add(*all_objects)
+        self.energy_system.add(*self.bus_objects.values(), *self.component_objects.values())
         
         # Statistiken ausgeben
         self._log_build_statistics()
@@ -105,31 +176,38 @@ class MultiIOSystemBuilder:
         freq = settings.get('timeindex_freq', 'h')
         
         timeindex = pd.date_range(start=start, periods=periods, freq=freq)
-        self.logger.info(f"⏰ Zeitindex: {timeindex[0]} bis {timeindex[-1]} ({len(timeindex)} Perioden)")
+        self.logger.info("⏰ Zeitindex: %s bis %s (%d Perioden)", timeindex[0], timeindex[-1], len(timeindex))
         
         return timeindex
     
     def _build_buses(self, excel_data: Dict[str, Any]):
         """Erstellt alle Bus-Objekte."""
-        if 'buses' not in excel_data:
+        if 'buses' not in self._available_sheets:
             self.logger.warning("⚠️ Keine Buses definiert")
             return
         
         buses_df = excel_data['buses']
+        if 'label' not in buses_df.columns:
+            self.logger.warning("⚠️ Buses-Sheet ohne 'label'-Spalte - keine Buses erstellt")
+            return
+        
         self.logger.info(f"🚌 Erstelle {len(buses_df)} Buses...")
         
-        for _, bus_data in buses_df.iterrows():
-            if bus_data.get('include', 0) != 1:
-                continue
-                
-            label = bus_data['label']
-            
+        # Doppelte Labels einmalig über die Hash-Tabelle von pandas entfernen
+        all_labels = self._included_rows(buses_df)['label']
+        labels = pd.unique(all_labels).tolist()
+        if len(labels) < len(all_labels):
+            self.logger.warning(f"⚠️ {len(all_labels) - len(labels)} doppelte Bus-Labels ignoriert")
+        
+        solph = _load_solph()
+        for label in labels:
             try:
                 bus = solph.buses.Bus(label=label)
                 self.bus_objects[label] = bus
+                self.bus_connections[label] = {'input': 0, 'output': 0}
                 self.build_stats['buses'] += 1
                 
-                self.logger.debug(f"      ✓ Bus: {label}")
+                self.logger.debug("      ✓ Bus: %s", label)
                 
             except Exception as e:
                 self.logger.error(f"❌ Fehler beim Erstellen von Bus '{label}': {e}")
@@ -137,19 +215,17 @@ class MultiIOSystemBuilder:
     
     def _build_sources(self, excel_data: Dict[str, Any]):
         """Erstellt alle Source-Objekte."""
-        if 'sources' not in excel_data:
+        if 'sources' not in self._available_sheets:
             self.logger.info("   ⏭️ Keine Sources definiert")
             return
         
         sources_df = excel_data['sources']
-        timeseries_data = excel_data.get('timeseries', pd.DataFrame())
+        timeseries_data = excel_data.get('timeseries', _EMPTY_TIMESERIES)
         
         self.logger.info(f"   ⚡ Erstelle {len(sources_df)} Sources...")
         
-        for _, source_data in sources_df.iterrows():
-            if source_data.get('include', 0) != 1:
-                continue
-                
+        solph = _load_solph()
+        for _, source_data in self._included_rows(sources_df).iterrows():
             label = source_data['label']
             
             try:
@@ -179,9 +255,9 @@ class MultiIOSystemBuilder:
                     self.build_stats['investments'] += 1
                     
                 if len(output_buses) > 1:
-                    self.logger.debug(f"      ✓ Multi-Output Source: {label} → {output_buses}")
+                    self.logger.debug("      ✓ Multi-Output Source: %s → %s", label, output_buses)
                 else:
-                    self.logger.debug(f"      ✓ Source: {label} → {output_buses[0]}")
+                    self.logger.debug("      ✓ Source: %s → %s", label, output_buses[0])
                 
             except Exception as e:
                 self.logger.error(f"❌ Fehler beim Erstellen von Source '{label}': {e}")
@@ -189,19 +265,17 @@ class MultiIOSystemBuilder:
     
     def _build_sinks(self, excel_data: Dict[str, Any]):
         """Erstellt alle Sink-Objekte."""
-        if 'sinks' not in excel_data:
+        if 'sinks' not in self._available_sheets:
             self.logger.info("   ⏭️ Keine Sinks definiert")
             return
         
         sinks_df = excel_data['sinks']
-        timeseries_data = excel_data.get('timeseries', pd.DataFrame())
+        timeseries_data = excel_data.get('timeseries', _EMPTY_TIMESERIES)
         
         self.logger.info(f"   🔽 Erstelle {len(sinks_df)} Sinks...")
         
-        for _, sink_data in sinks_df.iterrows():
-            if sink_data.get('include', 0) != 1:
-                continue
-                
+        solph = _load_solph()
+        for _, sink_data in self._included_rows(sinks_df).iterrows():
             label = sink_data['label']
             
             try:
@@ -231,9 +305,9 @@ class MultiIOSystemBuilder:
                     self.build_stats['investments'] += 1
                     
                 if len(input_buses) > 1:
-                    self.logger.debug(f"      ✓ Multi-Input Sink: {input_buses} → {label}")
+                    self.logger.debug("      ✓ Multi-Input Sink: %s → %s", input_buses, label)
                 else:
-                    self.logger.debug(f"      ✓ Sink: {input_buses[0]} → {label}")
+                    self.logger.debug("      ✓ Sink: %s → %s", input_buses[0], label)
                 
             except Exception as e:
                 self.logger.error(f"❌ Fehler beim Erstellen von Sink '{label}': {e}")
@@ -241,19 +315,18 @@ class MultiIOSystemBuilder:
     
     def _build_multi_transformers(self, excel_data: Dict[str, Any]):
         """Erstellt alle Multi-Input/Output-Transformer-Objekte."""
-        if 'simple_transformers' not in excel_data:
+        if 'simple_transformers' not in self._available_sheets:
             self.logger.info("   ⏭️ Keine Transformers definiert")
             return
         
         transformers_df = excel_data['simple_transformers']
-        timeseries_data = excel_data.get('timeseries', pd.DataFrame())
+        timeseries_data = excel_data.get('timeseries', _EMPTY_TIMESERIES)
         
         self.logger.info(f"   🔄 Erstelle {len(transformers_df)} Multi-IO-Transformers...")
+        self._parsed_factors.clear()
         
-        for _, transformer_data in transformers_df.iterrows():
-            if transformer_data.get('include', 0) != 1:
-                continue
-                
+        solph = _load_solph()
+        for _, transformer_data in self._included_rows(transformers_df).iterrows():
             label = transformer_data['label']
             
             try:
@@ -303,15 +376,33 @@ class MultiIOSystemBuilder:
                 if len(output_buses) > 1:
                     self.build_stats['multi_output_transformers'] += 1
                 
-                # Logging
-                input_str = " + ".join(input_buses) if len(input_buses) > 1 else input_buses[0]
-                output_str = " + ".join(output_buses) if len(output_buses) > 1 else output_buses[0]
-                self.logger.debug(f"      ✓ Transformer: {input_str} → {output_str}")
+                # Logging (Strings nur bauen, wenn DEBUG aktiv ist)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    input_str = " + ".join(input_buses) if len(input_buses) > 1 else input_buses[0]
+                    output_str = " + ".join(output_buses) if len(output_buses) > 1 else output_buses[0]
+                    self.logger.debug("      ✓ Transformer: %s → %s", input_str, output_str)
                 
             except Exception as e:
                 self.logger.error(f"❌ Fehler beim Erstellen von Transformer '{label}': {e}")
                 raise
     
+    def _included_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filtert die aktiven Zeilen (include == 1) vektorisiert.
+        
+        Deaktivierte Zeilen werden so gar nicht erst als Series erzeugt.
+        
+        Args:
+            df: Komponenten-DataFrame
+            
+        Returns:
+            DataFrame mit den aktiven Zeilen
+        """
+        if 'include' not in df.columns:
+            return df.iloc[0:0]
+        
+        return df[df['include'] == 1]
+    
     def _parse_bus_list(self, bus_string: str) -> List[str]:
         """
         Parst Bus-String mit Trennzeichen.
@@ -325,13 +416,7 @@ class MultiIOSystemBuilder:
         if not bus_string or pd.isna(bus_string):
             return []
         
-        bus_str = str(bus_string).strip()
-        
-        if self.bus_separator in bus_str:
-            bus_list = [bus.strip() for bus in bus_str.split(self.bus_separator)]
-            return [bus for bus in bus_list if bus]  # Leere entfernen
-        else:
-            return [bus_str] if bus_str else []
+        return list(_split_bus_string(str(bus_string).strip(), self.bus_separator))
     
     def _parse_conversion_factors(self, factor_string: str, expected_count: int) -> List[float]:
         """
@@ -379,33 +464,40 @@ class MultiIOSystemBuilder:
         """
         flows = {}
         
+        # Profil ist für alle Flows der Komponente gleich: nur einmal verarbeiten
+        profile = self._process_profiles(component_data, timeseries_data, flow_type) if bus_list else None
+        
+        bus_objects = self.bus_objects
+        bus_connections = self.bus_connections
+        
         for i, bus_name in enumerate(bus_list):
-            # Bus-Objekt auflösen
-            if bus_name not in self.bus_objects:
+            # Bus-Objekt auflösen (eine Dict-Abfrage statt 'in' + Index)
+            bus_obj = bus_objects.get(bus_name)
+            if bus_obj is None:
                 raise ValueError(f"Bus '{bus_name}' nicht gefunden")
             
-            bus_obj = self.bus_objects[bus_name]
+            bus_connections[bus_name][flow_type] += 1
             
             # Investment nur für ersten Flow (Index 0)
             if i == 0:
                 # Erster Flow: mit Investment-Möglichkeit
-                flow = self._create_investment_flow(component_data, timeseries_data, flow_type)
+                flow = self._create_investment_flow(component_data, profile, flow_type)
             else:
                 # Weitere Flows: ohne Investment
-                flow = self._create_standard_flow(component_data, timeseries_data, flow_type)
+                flow = self._create_standard_flow(component_data, profile, flow_type)
             
             flows[bus_obj] = flow
         
         return flows
     
-    def _create_investment_flow(self, component_data: pd.Series, timeseries_data: pd.DataFrame, 
-                               flow_type: str) -> Flow:
+    def _create_investment_flow(self, component_data: pd.Series, profile: Optional[np.ndarray], 
+                               flow_type: str) -> 'solph.Flow':
         """
         Erstellt einen Flow mit Investment-Möglichkeit.
         
         Args:
             component_data: Komponenten-Daten
-            timeseries_data: Zeitreihendaten
+            profile: Bereits verarbeitetes Profil oder None
             flow_type: 'input' oder 'output'
             
         Returns:
@@ -426,34 +518,33 @@ class MultiIOSystemBuilder:
             except (ValueError, TypeError):
                 pass
         
-        # Profile verarbeiten
-        profile = self._process_profiles(component_data, timeseries_data, flow_type)
+        # Profil anwenden
         if profile is not None:
             if flow_type == 'input':
                 # Für Inputs: fix profile
                 flow_params['fix'] = profile
                 # Auto-Kapazität wenn nicht gesetzt
                 if 'nominal_capacity' not in flow_params:
-                    flow_params['nominal_capacity'] = max(profile) * 1.2
+                    flow_params['nominal_capacity'] = float(profile.max()) * 1.2
             else:
                 # Für Outputs: max profile
                 flow_params['max'] = profile
         
         # Flow erstellen
         try:
-            return Flow(**flow_params)
+            return _load_solph().Flow(**flow_params)
         except Exception as e:
             self.logger.warning(f"Fehler beim Erstellen des Investment-Flows: {e}")
-            return Flow()
+            return _load_solph().Flow()
     
-    def _create_standard_flow(self, component_data: pd.Series, timeseries_data: pd.DataFrame, 
-                             flow_type: str) -> Flow:
+    def _create_standard_flow(self, component_data: pd.Series, profile: Optional[np.ndarray], 
+                             flow_type: str) -> 'solph.Flow':
         """
         Erstellt einen Standard-Flow ohne Investment.
         
         Args:
             component_data: Komponenten-Daten
-            timeseries_data: Zeitreihendaten
+            profile: Bereits verarbeitetes Profil oder None
             flow_type: 'input' oder 'output'
             
         Returns:
@@ -478,8 +569,7 @@ class MultiIOSystemBuilder:
             except (ValueError, TypeError):
                 pass
         
-        # Profile verarbeiten (vereinfacht)
-        profile = self._process_profiles(component_data, timeseries_data, flow_type)
+        # Profil anwenden (vereinfacht)
         if profile is not None:
             if flow_type == 'input':
                 flow_params['fix'] = profile
@@ -488,12 +578,12 @@ class MultiIOSystemBuilder:
         
         # Flow erstellen
         try:
-            return Flow(**flow_params)
+            return _load_solph().Flow(**flow_params)
         except Exception as e:
             self.logger.warning(f"Fehler beim Erstellen des Standard-Flows: {e}")
-            return Flow()
+            return _load_solph().Flow()
     
-    def _process_investment_capacity(self, component_data: pd.Series) -> Optional[Union[float, Investment]]:
+    def _process_investment_capacity(self, component_data: pd.Series) -> Optional[Union[float, 'solph.Investment']]:
         """
         Verarbeitet Investment-Kapazität mit Annuity-Berechnung.
         
@@ -525,7 +615,7 @@ class MultiIOSystemBuilder:
             ep_costs = self._calculate_ep_costs(component_data, investment_costs)
             
             # Investment-Objekt erstellen
-            investment = Investment(
+            investment = _load_solph().Investment(
                 ep_costs=ep_costs,
                 existing=existing,
                 minimum=invest_min,
@@ -573,7 +663,7 @@ class MultiIOSystemBuilder:
         return investment_costs
     
     def _process_profiles(self, component_data: pd.Series, timeseries_data: pd.DataFrame, 
-                         flow_type: str) -> Optional[List[float]]:
+                         flow_type: str) -> Optional[np.ndarray]:
         """
         Verarbeitet Profile aus Zeitreihendaten.
         
@@ -583,7 +673,7 @@ class MultiIOSystemBuilder:
             flow_type: 'input' oder 'output'
             
         Returns:
-            Liste der Profil-Werte
+            Array der Profil-Werte (float64, kein Python-Listen-Umweg)
         """
         profile_column = component_data.get('profile_column', '')
         
@@ -594,16 +684,18 @@ class MultiIOSystemBuilder:
             self.logger.warning(f"Profil-Spalte '{profile_column}' nicht in Zeitreihendaten gefunden")
             return None
         
-        profile_values = timeseries_data[profile_column].values
+        profile_values = timeseries_data[profile_column].to_numpy(dtype=float)
         
         if len(profile_values) == 0:
             return None
         
-        # Für Sources: Normalisierung auf max=1.0
-        if flow_type == 'output' and max(profile_values) > 1.0:
-            profile_values = profile_values / max(profile_values)
+        # Für Sources: Normalisierung auf max=1.0 (Maximum einmal vektorisiert bestimmen)
+        if flow_type == 'output':
+            peak = profile_values.max()
+            if peak > 1.0:
+                profile_values = profile_values / peak
         
-        return profile_values.tolist()
+        return profile_values
     
     def _create_conversion_factors(self, transformer_data: pd.Series, output_buses: List[str], 
                                   output_flows: Dict[Any, Any]) -> Dict[Any, float]:
@@ -623,16 +715,19 @@ class MultiIOSystemBuilder:
         if len(output_buses) == 1:
             # Single-Output: conversion_factor verwenden
             factor = float(transformer_data.get('conversion_factor', 1.0))
-            bus_obj = list(output_flows.keys())[0]
+            bus_obj = next(iter(output_flows))
             conversion_factors[bus_obj] = factor
         else:
             # Multi-Output: output_conversion_factors verwenden
-            factors_str = transformer_data.get('output_conversion_factors', 
-                                              transformer_data.get('conversion_factor', '1.0'))
-            factors = self._parse_conversion_factors(factors_str, len(output_buses))
+            # Bereits bei der Validierung geparste Faktoren wiederverwenden
+            factors = self._parsed_factors.get(transformer_data.get('label'))
+            if factors is None:
+                factors_str = transformer_data.get('output_conversion_factors', 
+                                                  transformer_data.get('conversion_factor', '1.0'))
+                factors = self._parse_conversion_factors(factors_str, len(output_buses))
             
-            for i, (bus_obj, flow) in enumerate(output_flows.items()):
-                conversion_factors[bus_obj] = factors[i]
+            # output_flows behält die Reihenfolge von output_buses (Dict-Einfügereihenfolge)
+            conversion_factors.update(zip(output_flows, factors))
         
         return conversion_factors
     
@@ -657,8 +752,9 @@ class MultiIOSystemBuilder:
             return False
         
         # Alle Busse existieren?
-        for bus_name in input_buses + output_buses:
-            if bus_name not in self.bus_objects:
+        bus_objects = self.bus_objects
+        for bus_name in (*input_buses, *output_buses):
+            if bus_name not in bus_objects:
                 self.logger.error(f"Transformer '{label}': Bus '{bus_name}' nicht gefunden")
                 return False
         
@@ -671,6 +767,7 @@ class MultiIOSystemBuilder:
                 if len(factors) != len(output_buses):
                     self.logger.error(f"Transformer '{label}': Anzahl Conversion-Faktoren stimmt nicht")
                     return False
+                self._parsed_factors[label] = factors
             except ValueError as e:
                 self.logger.error(f"Transformer '{label}': {e}")
                 return False
@@ -679,12 +776,20 @@ class MultiIOSystemBuilder:
     
     def _log_build_statistics(self):
         """Gibt Aufbau-Statistiken aus."""
-        self.logger.info("📊 Multi-IO Aufbau-Statistiken:")
-        for component_type, count in self.build_stats.items():
-            if count > 0:
-                self.logger.info(f"   {component_type.replace('_', ' ').title()}: {count}")
+        # Statistik-Zeilen nur aufbereiten, wenn INFO überhaupt ausgegeben wird
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("📊 Multi-IO Aufbau-Statistiken:")
+            for component_type, count in self.build_stats.items():
+                if count > 0:
+                    self.logger.info(f"   {component_type.replace('_', ' ').title()}: {count}")
+        
+        # Busse ohne Flows (Index wurde beim Aufbau in O(Komponenten) gefüllt)
+        isolated = [label for label, counts in self.bus_connections.items()
+                    if not counts['input'] and not counts['output']]
+        if isolated:
+            self.logger.warning(f"⚠️ Busse ohne Verbindungen: {', '.join(map(str, isolated))}")
     
-    def get_system_summary(self, energy_system: solph.EnergySystem) -> Dict[str, str]:
+    def get_system_summary(self, energy_system: 'solph.EnergySystem') -> Dict[str, str]:
         """
         Erstellt eine Zusammenfassung des Multi-IO-Energiesystems.
         
@@ -694,6 +799,8 @@ class MultiIOSystemBuilder:
         Returns:
             Dictionary mit Zusammenfassungsinformationen
         """
+        solph = _load_solph()
+        
         summary = {}
         
         # Zeitindex-Informationen
@@ -704,24 +811,22 @@ class MultiIOSystemBuilder:
         # Komponenten-Statistiken
         nodes = energy_system.nodes
         
-        # Nach Typen klassifizieren
-        buses = [n for n in nodes if isinstance(n, solph.buses.Bus)]
-        sources = [n for n in nodes if isinstance(n, solph.components.Source)]
-        sinks = [n for n in nodes if isinstance(n, solph.components.Sink)]
-        converters = [n for n in nodes if isinstance(n, solph.components.Converter)]
-        
-        summary['Buses'] = str(len(buses))
-        summary['Sources'] = str(len(sources))
-        summary['Sinks'] = str(len(sinks))
-        summary['Converter'] = str(len(converters))
-        
-        # Multi-IO-Statistiken
-        summary['Multi-Input-Transformer'] = str(self.build_stats.get('multi_input_transformers', 0))
-        summary['Multi-Output-Transformer'] = str(self.build_stats.get('multi_output_transformers', 0))
-        
-        # Investment-Komponenten zählen
+        # Nach Typen klassifizieren und Investment-Flows zählen (ein Durchlauf)
+        node_types = (
+            ('Buses', solph.buses.Bus),
+            ('Sources', solph.components.Source),
+            ('Sinks', solph.components.Sink),
+            ('Converter', solph.components.Converter)
+        )
+        type_counts = dict.fromkeys((name for name, _ in node_types), 0)
         investment_count = 0
+        
         for node in nodes:
+            for name, node_type in node_types:
+                if isinstance(node, node_type):
+                    type_counts[name] += 1
+                    break
+            
             if hasattr(node, 'inputs'):
                 for flow in node.inputs.values():
                     if hasattr(flow, 'investment') and flow.investment is not None:
@@ -731,6 +836,13 @@ class MultiIOSystemBuilder:
                     if hasattr(flow, 'investment') and flow.investment is not None:
                         investment_count += 1
         
+        for name, count in type_counts.items():
+            summary[name] = str(count)
+        
+        # Multi-IO-Statistiken
+        summary['Multi-Input-Transformer'] = str(self.build_stats.get('multi_input_transformers', 0))
+        summary['Multi-Output-Transformer'] = str(self.build_stats.get('multi_output_transformers', 0))
+        
         if investment_count > 0:
             summary['Investment-Flows'] = str(investment_count)
         
@@ -135,17 +135,10 @@ class TimestepManager:
         }
         
         # Statistiken
-        original_periods = len(original_timeindex)
-        final_periods = len(new_timeindex)
-        
-        self.reduction_stats = {
-            'strategy': 'time_range',
-            'original_periods': original_periods,
-            'final_periods': final_periods,
-            'reduction_factor': final_periods / original_periods,
-            'time_savings': f"{((original_periods - final_periods) / original_periods * 100):.1f}%",
-            'selected_range': f"{start_date} to {end_date}"
-        }
+        self.reduction_stats = self._build_reduction_stats(
+            'time_range', len(original_timeindex), len(new_timeindex),
+            selected_range=f"{start_date} to {end_date}"
+        )
         
         return processed_data
     
@@ -197,17 +190,10 @@ class TimestepManager:
         }
         
         # Statistiken
-        original_periods = len(original_timeindex)
-        final_periods = len(new_timeindex)
-        
-        self.reduction_stats = {
-            'strategy': 'averaging',
-            'original_periods': original_periods,
-            'final_periods': final_periods,
-            'reduction_factor': final_periods / original_periods,
-            'time_savings': f"{((original_periods - final_periods) / original_periods * 100):.1f}%",
-            'averaging_hours': hours
-        }
+        self.reduction_stats = self._build_reduction_stats(
+            'averaging', len(original_timeindex), len(new_timeindex),
+            averaging_hours=hours
+        )
         
         return processed_data
     
@@ -255,18 +241,11 @@ class TimestepManager:
         }
         
         # Statistiken
-        original_periods = len(original_timeindex)
-        final_periods = len(new_timeindex)
-        
-        self.reduction_stats = {
-            'strategy': 'sampling_24n',
-            'original_periods': original_periods,
-            'final_periods': final_periods,
-            'reduction_factor': final_periods / original_periods,
-            'time_savings': f"{((original_periods - final_periods) / original_periods * 100):.1f}%",
-            'n_factor': n,
-            'sampling_pattern': self._describe_sampling_pattern(n)
-        }
+        self.reduction_stats = self._build_reduction_stats(
+            'sampling_24n', len(original_timeindex), len(new_timeindex),
+            n_factor=n,
+            sampling_pattern=self._describe_sampling_pattern(n)
+        )
         
         return processed_data
     
@@ -437,6 +416,33 @@ class TimestepManager:
         
         return timeseries_df.iloc[valid_indices].reset_index(drop=True)
     
+    def _build_reduction_stats(self, strategy: str, original_periods: int,
+                               final_periods: int, **details) -> Dict[str, Any]:
+        """
+        Erstellt das Statistik-Dictionary einer Zeitreduktion.
+        
+        Reduktionsfaktor und Zeitersparnis werden hier einmalig berechnet bzw.
+        formatiert und von Log-Ausgabe und Visualisierung wiederverwendet.
+        
+        Args:
+            strategy: Name der Strategie
+            original_periods: Anzahl ursprünglicher Zeitschritte
+            final_periods: Anzahl Zeitschritte nach der Reduktion
+            **details: Strategie-spezifische Zusatzangaben
+            
+        Returns:
+            Dictionary mit Zeitreduktions-Statistiken
+        """
+        stats = {
+            'strategy': strategy,
+            'original_periods': original_periods,
+            'final_periods': final_periods,
+            'reduction_factor': final_periods / original_periods,
+            'time_savings': f"{((original_periods - final_periods) / original_periods * 100):.1f}%",
+        }
+        stats.update(details)
+        return stats
+    
     def _describe_sampling_pattern(self, n: float) -> str:
         """Beschreibt das Sampling-Muster in verständlicher Form."""
         if n == 1:
@@ -457,22 +463,29 @@ class TimestepManager:
             return f"Alle {60/n:.0f} Minuten" if n < 1 else f"Alle {n:.1f} Stunden"
     
     def _log_reduction_statistics(self):
-        """Loggt Zeitreduktions-Statistiken."""
+        """Loggt Zeitreduktions-Statistiken (als eine mehrzeilige Meldung)."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         stats = self.reduction_stats
         
-        self.logger.info(f"   📊 Zeitreduktions-Statistiken:")
-        self.logger.info(f"      Original: {stats['original_periods']:,} Zeitschritte")
-        self.logger.info(f"      Final: {stats['final_periods']:,} Zeitschritte")
-        self.logger.info(f"      Reduktion: {stats['time_savings']}")
-        self.logger.info(f"      Faktor: {stats['reduction_factor']:.3f}")
+        lines = [
+            "   📊 Zeitreduktions-Statistiken:",
+            f"      Original: {stats['original_periods']:,} Zeitschritte",
+            f"      Final: {stats['final_periods']:,} Zeitschritte",
+            f"      Reduktion: {stats['time_savings']}",
+            f"      Faktor: {stats['reduction_factor']:.3f}",
+        ]
         
         # Strategie-spezifische Details
         if stats['strategy'] == 'time_range':
-            self.logger.info(f"      Zeitbereich: {stats['selected_range']}")
+            lines.append(f"      Zeitbereich: {stats['selected_range']}")
         elif stats['strategy'] == 'averaging':
-            self.logger.info(f"      Mittelwert: {stats['averaging_hours']}h-Intervalle")
+            lines.append(f"      Mittelwert: {stats['averaging_hours']}h-Intervalle")
         elif stats['strategy'] == 'sampling_24n':
-            self.logger.info(f"      Sampling: n={stats['n_factor']} ({stats['sampling_pattern']})")
+            lines.append(f"      Sampling: n={stats['n_factor']} ({stats['sampling_pattern']})")
+        
+        self.logger.info("\n".join(lines))
     
     def get_reduction_stats(self) -> Dict[str, Any]:
         """Gibt die Zeitreduktions-Statistiken zurück."""
@@ -11,6 +11,7 @@ Datum: Juli 2025
 Version: 1.0.0
 """
 
+from collections import defaultdict
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -149,7 +150,7 @@ class Visualizer:
         """Erstellt Energiebilanz-Balkendiagramm."""
         try:
             # Energie-Summen berechnen
-            energy_data = {}
+            energy_data = defaultdict(lambda: {'output': 0, 'input': 0})
             
             for (source, target), flow_results in results.items():
                 if 'sequences' in flow_results and 'flow' in flow_results['sequences']:
@@ -158,11 +159,6 @@ class Visualizer:
                     
                     # Nach Source und Target kategorisieren
                     if total_energy > 0:
-                        if str(source) not in energy_data:
-                            energy_data[str(source)] = {'output': 0, 'input': 0}
-                        if str(target) not in energy_data:
-                            energy_data[str(target)] = {'output': 0, 'input': 0}
-                        
                         energy_data[str(source)]['output'] += total_energy
                         energy_data[str(target)]['input'] += total_energy
             
@@ -11,8 +11,14 @@ Datum: Juli 2025
 Version: 2.0.0 (Refactored)
 """
 
+import importlib.util
+import os
+import re
 import sys
 import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -22,13 +28,23 @@ from ui.project_selector import ProjectSelector
 from config.config_manager import ConfigManager
 from utils.file_utils import FileUtils
 
-# Importiere die main-Funktion aus dem ursprünglichen main.py
-try:
-    from main import main_program
-except ImportError as e:
-    print(f"❌ Fehler beim Importieren von main.py: {e}")
-    print("Stellen Sie sicher, dass main.py im selben Verzeichnis vorhanden ist.")
-    sys.exit(1)
+# Gültige Eingabe für die Export-Format-Auswahl, z.B. "2" oder "1, 3"
+_FORMAT_CHOICE_RE = re.compile(r'\s*\d+(?:\s*,\s*\d+)*\s*')
+
+# Statischer Menütext der erweiterten Einstellungen (einmalig gebildet)
+_ADVANCED_MENU_TEXT = "\n".join([
+    "\n🔧 ERWEITERTE EINSTELLUNGEN",
+    "-" * 40,
+    "",
+    "1. 🔨 Solver-Einstellungen",
+    "2. 🐛 Debug-Modus",
+    "3. 📊 Visualisierung",
+    "4. 📤 Export-Formate",
+    "5. 🕒 Timestep-Einstellungen",
+    "6. 📋 Konfiguration anzeigen",
+    "7. 🔄 Auf Standards zurücksetzen",
+    "8. ↩️ Zurück",
+]) + "\n"
 
 
 class ProjectRunner:
@@ -37,6 +53,9 @@ class ProjectRunner:
     Orchestriert die verschiedenen Komponenten.
     """
     
+    # Menü-Nummer -> Export-Format
+    _FORMAT_CHOICES = {"1": "json", "2": "yaml", "3": "txt"}
+    
     def __init__(self):
         """Initialisiert den Project Runner."""
         self.setup_logging()
@@ -54,7 +73,10 @@ class ProjectRunner:
         self.directories = self.setup_directories()
         
         # Project Selector initialisieren
-        self.project_selector = ProjectSelector(self.directories['examples'])
+        self.project_selector = ProjectSelector(self.directories['examples'], self.menu_system)
+        
+        # main_program (oemof, pandas, ...) erst bei der ersten Projektausführung laden
+        self._main_program = None
         
         # Menu-Handler registrieren
         self.register_menu_handlers()
@@ -76,10 +98,13 @@ class ProjectRunner:
         logging.getLogger('oemof.network').setLevel(logging.WARNING)
         logging.getLogger('pyomo').setLevel(logging.WARNING)
     
-    def setup_directories(self) -> Dict[str, Path]:
+    def setup_directories(self, recheck: bool = False) -> Dict[str, Path]:
         """
         Richtet die Verzeichnisstruktur ein.
         
+        Args:
+            recheck: Bereits bekannte Verzeichnisse erneut prüfen
+        
         Returns:
             Dictionary mit Verzeichnis-Pfaden
         """
@@ -91,7 +116,7 @@ class ProjectRunner:
             directories[name] = self.project_root / path_str
         
         # Verzeichnisse erstellen
-        return self.file_utils.ensure_directory_structure(directories)
+        return self.file_utils.ensure_directory_structure(directories, recheck=recheck)
     
     def register_menu_handlers(self):
         """Registriert die Handler für das Menü-System."""
@@ -129,6 +154,29 @@ class ProjectRunner:
         """Handler für Test-Funktionen."""
         self.test_functions()
     
+    def load_main_program(self):
+        """
+        Importiert main_program aus main.py beim ersten Aufruf.
+        
+        Der Import zieht oemof.solph, pandas und alle Verarbeitungsmodule nach
+        und wird deshalb erst bei Bedarf statt beim Programmstart ausgeführt.
+        
+        Returns:
+            main_program-Funktion oder None bei Importfehler
+        """
+        if self._main_program is None:
+            try:
+                from main import main_program
+            except ImportError as e:
+                self.menu_system.show_error(
+                    f"Fehler beim Importieren von main.py: {e}",
+                    "Stellen Sie sicher, dass main.py im selben Verzeichnis vorhanden ist."
+                )
+                return None
+            self._main_program = main_program
+        
+        return self._main_program
+    
     def run_project(self, project: Dict[str, Any]):
         """
         Führt ein Projekt durch.
@@ -144,13 +192,17 @@ class ProjectRunner:
             self.menu_system.show_error("Projekt-Validierung fehlgeschlagen")
             return
         
+        main_program = self.load_main_program()
+        if main_program is None:
+            return
+        
         self.menu_system.show_info(f"Starte Projekt: {project_file.name}")
-        self.logger.info(f"Starte Projekt: {project_name}")
+        self.logger.info("Starte Projekt: %s", project_name)
         
-        # Konfiguration zusammenstellen
+        # Konfiguration zusammenstellen (schreibgeschützte Sichten statt Kopien)
         config = {
-            'modules': self.config_manager.get_module_config(),
-            'settings': self.config_manager.get_settings()
+            'modules': self.config_manager.get_module_config(read_only=True),
+            'settings': self.config_manager.get_settings(read_only=True)
         }
         
         try:
@@ -165,9 +217,19 @@ class ProjectRunner:
                 
         except Exception as e:
             self.menu_system.show_error(f"Fehler bei der Projektausführung: {e}")
-            if self.config_manager.get_setting('debug_mode', False):
-                import traceback
-                traceback.print_exc()
+            self.report_traceback()
+    
+    def report_traceback(self):
+        """
+        Gibt den Traceback der aktuell behandelten Ausnahme aus.
+        
+        Im Debug-Modus auf der Konsole, sonst nur wenn das DEBUG-Level
+        aktiv ist - format_exc() wird dann gar nicht erst aufgerufen.
+        """
+        if self.config_manager.get_setting('debug_mode', False):
+            traceback.print_exc()
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Traceback:\n%s", traceback.format_exc())
     
     def show_output_summary(self, project_name: str):
         """
@@ -178,20 +240,23 @@ class ProjectRunner:
         """
         output_dir = self.directories['output'] / project_name
         
-        if not output_dir.exists():
+        if not output_dir.is_dir():
             return
         
-        output_files = list(output_dir.glob("*"))
-        print(f"📁 {len(output_files)} Dateien erstellt in: {output_dir}")
+        # Nur zählen - keine Path-Objekte pro Eintrag anlegen
+        with os.scandir(output_dir) as entries:
+            output_count = sum(1 for _ in entries)
+        print(f"📁 {output_count} Dateien erstellt in: {output_dir}")
         
         # System-Export-Dateien hervorheben
         export_dir = output_dir / "system_exports"
-        if export_dir.exists():
-            export_files = list(export_dir.glob("*"))
-            if export_files:
-                print(f"📤 {len(export_files)} System-Export-Dateien:")
-                for export_file in export_files:
-                    print(f"   • {export_file.name}")
+        if export_dir.is_dir():
+            with os.scandir(export_dir) as entries:
+                export_names = [entry.name for entry in entries]
+            if export_names:
+                print(f"📤 {len(export_names)} System-Export-Dateien:")
+                for name in export_names:
+                    print(f"   • {name}")
     
     def configure_modules(self):
         """Konfiguriert Module-Einstellungen."""
@@ -201,94 +266,83 @@ class ProjectRunner:
             
             # Aktuelle Modul-Konfiguration anzeigen
             modules = self.config_manager.get_module_config()
-            for i, (module_name, enabled) in enumerate(modules.items(), 1):
-                status = "✓" if enabled else "✗"
-                print(f" {i}. {status} {module_name}")
+            module_keys = {str(i): module_name for i, module_name in enumerate(modules, 1)}
+            for key, module_name in module_keys.items():
+                status = "✓" if modules[module_name] else "✗"
+                print(f" {key}. {status} {module_name}")
+            
+            # Weitere Optionen hinter den Modulen nummerieren
+            actions = {
+                str(len(modules) + 1): self.configure_advanced_settings,
+                str(len(modules) + 2): self.save_config_interactive,
+            }
+            back_key = str(len(modules) + 3)
             
             print(f" {len(modules) + 1}. 🔧 Erweiterte Einstellungen")
             print(f" {len(modules) + 2}. 💾 Konfiguration speichern")
-            print(f" {len(modules) + 3}. ↩️ Zurück zum Hauptmenü")
+            print(f" {back_key}. ↩️ Zurück zum Hauptmenü")
             
-            choice = input("\nOption auswählen: ").strip()
+            choice = self.menu_system.prompt("\nOption auswählen: ").strip()
             
             try:
-                choice_num = int(choice)
-                module_names = list(modules.keys())
+                module_name = module_keys.get(choice)
+                action = actions.get(choice)
                 
-                if 1 <= choice_num <= len(modules):
+                if module_name:
                     # Modul umschalten
-                    module_name = module_names[choice_num - 1]
-                    current_state = modules[module_name]
-                    new_state = not current_state
-                    
+                    new_state = not modules[module_name]
                     self.config_manager.set_module_enabled(module_name, new_state)
                     
                     status = "aktiviert" if new_state else "deaktiviert"
                     self.menu_system.show_success(f"Modul '{module_name}' {status}")
-                
-                elif choice_num == len(modules) + 1:
-                    # Erweiterte Einstellungen
-                    self.configure_advanced_settings()
-                
-                elif choice_num == len(modules) + 2:
-                    # Konfiguration speichern
-                    if self.config_manager.save_config():
-                        self.menu_system.show_success("Konfiguration gespeichert")
-                    else:
-                        self.menu_system.show_error("Fehler beim Speichern der Konfiguration")
-                
-                elif choice_num == len(modules) + 3:
-                    # Zurück
+                elif action:
+                    action()
+                elif choice == back_key:
                     break
-                
                 else:
                     self.menu_system.show_error("Ungültige Auswahl")
                     
-            except ValueError:
-                self.menu_system.show_error("Ungültige Eingabe")
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 break
     
+    def save_config_interactive(self):
+        """Speichert die Konfiguration und meldet das Ergebnis."""
+        if self.config_manager.save_config():
+            self.menu_system.show_success("Konfiguration gespeichert")
+        else:
+            self.menu_system.show_error("Fehler beim Speichern der Konfiguration")
+    
     def configure_advanced_settings(self):
         """Konfiguriert erweiterte Einstellungen."""
+        actions = {
+            "1": self.configure_solver_settings,
+            "2": self.configure_debug_mode,
+            "3": self.configure_visualization,
+            "4": self.configure_export_formats,
+            "5": self.configure_timestep_settings,
+            "6": self.config_manager.show_config_summary,
+            "7": self.reset_config_interactive,
+        }
+        
         while True:
-            print("\n🔧 ERWEITERTE EINSTELLUNGEN")
-            print("-" * 40)
-            
-            settings = self.config_manager.get_settings()
-            
-            print("1. 🔨 Solver-Einstellungen")
-            print("2. 🐛 Debug-Modus")
-            print("3. 📊 Visualisierung")
-            print("4. 📤 Export-Formate")
-            print("5. 🕒 Timestep-Einstellungen")
-            print("6. 📋 Konfiguration anzeigen")
-            print("7. 🔄 Auf Standards zurücksetzen")
-            print("8. ↩️ Zurück")
+            sys.stdout.write(_ADVANCED_MENU_TEXT)
             
-            choice = input("\nOption auswählen: ").strip()
+            choice = self.menu_system.prompt("\nOption auswählen: ").strip()
             
-            if choice == "1":
-                self.configure_solver_settings()
-            elif choice == "2":
-                self.configure_debug_mode()
-            elif choice == "3":
-                self.configure_visualization()
-            elif choice == "4":
-                self.configure_export_formats()
-            elif choice == "5":
-                self.configure_timestep_settings()
-            elif choice == "6":
-                self.config_manager.show_config_summary()
-            elif choice == "7":
-                if self.menu_system.show_confirmation("Konfiguration wirklich zurücksetzen?"):
-                    self.config_manager.reset_to_defaults()
-                    self.menu_system.show_success("Konfiguration zurückgesetzt")
+            action = actions.get(choice)
+            if action:
+                action()
             elif choice == "8":
                 break
             else:
                 self.menu_system.show_error("Ungültige Auswahl")
     
+    def reset_config_interactive(self):
+        """Setzt die Konfiguration nach Rückfrage auf Standardwerte zurück."""
+        if self.menu_system.show_confirmation("Konfiguration wirklich zurücksetzen?"):
+            self.config_manager.reset_to_defaults()
+            self.menu_system.show_success("Konfiguration zurückgesetzt")
+    
     def configure_solver_settings(self):
         """Konfiguriert Solver-Einstellungen."""
         current_solver = self.config_manager.get_setting('solver', 'cbc')
@@ -310,6 +364,43 @@ class ProjectRunner:
             new_solver = solver_options[choice]
             self.config_manager.set_setting('solver', new_solver)
             self.menu_system.show_success(f"Solver auf '{new_solver}' gesetzt")
+        
+        if self.menu_system.show_confirmation("Solver-Parameter (Threads, MIP-Gap, Zeitlimit) anpassen?"):
+            self.configure_solver_parameters()
+    
+    def configure_solver_parameters(self):
+        """Konfiguriert Threads, MIP-Gap und Zeitlimit des Solvers."""
+        threads = self.config_manager.get_setting('solver_threads')
+        mip_gap = self.config_manager.get_setting('solver_mip_gap')
+        time_limit = self.config_manager.get_setting('solver_time_limit')
+        
+        threads_input = self.menu_system.show_input_dialog(
+            "Threads (leer = Solver-Standard)", str(threads or ""))
+        gap_input = self.menu_system.show_input_dialog(
+            "Relativer MIP-Gap (leer = Solver-Standard)", "" if mip_gap is None else str(mip_gap))
+        limit_input = self.menu_system.show_input_dialog(
+            "Zeitlimit in Sekunden (leer = unbegrenzt)", str(time_limit or ""))
+        
+        if threads_input is None or gap_input is None or limit_input is None:
+            return
+        
+        try:
+            new_threads = int(threads_input) if threads_input else None
+            new_gap = float(gap_input) if gap_input else None
+            new_limit = int(limit_input) if limit_input else None
+        except ValueError:
+            self.menu_system.show_error("Ungültige Eingabe")
+            return
+        
+        self.config_manager.set_setting('solver_threads', new_threads)
+        self.config_manager.set_setting('solver_mip_gap', new_gap)
+        self.config_manager.set_setting('solver_time_limit', new_limit)
+        
+        warmstart = self.config_manager.get_setting('solver_warmstart', False)
+        self.config_manager.set_setting('solver_warmstart', self.menu_system.show_confirmation(
+            "Warmstart (MIP-Start) verwenden?", default=warmstart))
+        
+        self.menu_system.show_success("Solver-Parameter gesetzt")
     
     def configure_debug_mode(self):
         """Konfiguriert Debug-Modus."""
@@ -337,34 +428,34 @@ class ProjectRunner:
     
     def configure_export_formats(self):
         """Konfiguriert Export-Formate."""
-        available_formats = ['json', 'yaml', 'txt']
         current_formats = self.config_manager.get_setting('export_formats', [])
         
         print("\n📤 EXPORT-FORMATE KONFIGURIEREN")
         print("-" * 40)
         
-        for i, fmt in enumerate(available_formats, 1):
+        for key, fmt in self._FORMAT_CHOICES.items():
             status = "✓" if fmt in current_formats else "✗"
-            print(f" {i}. {status} {fmt.upper()}")
+            print(f" {key}. {status} {fmt.upper()}")
         
-        choice = input("\nFormat umschalten (Nummer): ").strip()
+        choice = self.menu_system.prompt("\nFormat umschalten (Nummer, z.B. 1,3): ")
         
-        try:
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(available_formats):
-                fmt = available_formats[choice_num - 1]
-                
-                if fmt in current_formats:
-                    current_formats.remove(fmt)
-                    self.menu_system.show_success(f"Format '{fmt}' deaktiviert")
-                else:
-                    current_formats.append(fmt)
-                    self.menu_system.show_success(f"Format '{fmt}' aktiviert")
-                
-                self.config_manager.set_setting('export_formats', current_formats)
-                
-        except ValueError:
+        # Eingabe einmalig prüfen statt pro Eintrag zu parsen
+        if not _FORMAT_CHOICE_RE.fullmatch(choice):
             self.menu_system.show_error("Ungültige Eingabe")
+            return
+        
+        for key in choice.split(','):
+            fmt = self._FORMAT_CHOICES.get(key.strip())
+            if fmt is None:
+                self.menu_system.show_error(f"Ungültige Auswahl: {key.strip()}")
+            elif fmt in current_formats:
+                current_formats.remove(fmt)
+                self.menu_system.show_success(f"Format '{fmt}' deaktiviert")
+            else:
+                current_formats.append(fmt)
+                self.menu_system.show_success(f"Format '{fmt}' aktiviert")
+        
+        self.config_manager.set_setting('export_formats', current_formats)
     
     def configure_timestep_settings(self):
         """Konfiguriert Timestep-Einstellungen."""
@@ -420,8 +511,8 @@ class ProjectRunner:
         
         print("Erstelle erforderliche Verzeichnisse...")
         
-        # Verzeichnisse neu erstellen
-        self.directories = self.setup_directories()
+        # Verzeichnisse neu erstellen (auch zwischenzeitlich gelöschte)
+        self.directories = self.setup_directories(recheck=True)
         
         for name, path in self.directories.items():
             print(f"✅ {name}: {path}")
@@ -442,14 +533,21 @@ class ProjectRunner:
         ]
         
         missing_modules = []
+        modules_dir = self.directories['modules']
         
-        for module_name in required_modules:
-            module_file = self.directories['modules'] / f"{module_name}.py"
-            if module_file.exists():
-                print(f"✅ {module_name}.py")
-            else:
-                print(f"❌ {module_name}.py (fehlt)")
-                missing_modules.append(module_name)
+        # stat-Aufrufe parallel ausführen (exists() gibt den GIL frei)
+        with ThreadPoolExecutor(max_workers=len(required_modules)) as executor:
+            results = executor.map(
+                lambda name: (name, (modules_dir / f"{name}.py").exists()),
+                required_modules
+            )
+            
+            for module_name, exists in results:
+                if exists:
+                    print(f"✅ {module_name}.py")
+                else:
+                    print(f"❌ {module_name}.py (fehlt)")
+                    missing_modules.append(module_name)
         
         if missing_modules:
             self.menu_system.show_warning(
@@ -461,43 +559,44 @@ class ProjectRunner:
     
     def show_project_info(self):
         """Zeigt Projektinformationen an."""
-        print("\n📋 PROJEKTINFORMATIONEN")
-        print("=" * 50)
-        
-        # Basis-Informationen
-        print(f"Projektverzeichnis: {self.project_root}")
-        print(f"Verfügbare Projekte: {self.project_selector.get_project_count()}")
+        # Ausgabe gesammelt aufbauen und mit einem write ausgeben
+        lines = [
+            "\n📋 PROJEKTINFORMATIONEN",
+            "=" * 50,
+            f"Projektverzeichnis: {self.project_root}",
+            f"Verfügbare Projekte: {self.project_selector.get_project_count()}",
+        ]
         
-        # Verzeichnisse
-        print("\nVerzeichnisse:")
-        for name, path in self.directories.items():
-            exists = "✅" if path.exists() else "❌"
-            print(f"  {exists} {name}: {path}")
+        # Verzeichnisse (relativ zum Projektverzeichnis, reine String-Operation)
+        lines.append("\nVerzeichnisse:")
+        lines.extend(
+            f"  {'✅' if path.exists() else '❌'} {name}: {os.path.relpath(path, self.project_root)}"
+            for name, path in self.directories.items()
+        )
         
         # Zuletzt geänderte Projekte
-        print("\nZuletzt geänderte Projekte:")
-        recent_projects = self.project_selector.get_recent_projects(3)
-        for project in recent_projects:
-            import time
-            mod_time = time.strftime('%Y-%m-%d %H:%M', 
-                                   time.localtime(project['modified']))
-            print(f"  📋 {project['name']} ({mod_time})")
+        lines.append("\nZuletzt geänderte Projekte:")
+        lines.extend(
+            f"  📋 {project['name']} ({datetime.fromtimestamp(project['modified']):%Y-%m-%d %H:%M})"
+            for project in self.project_selector.get_recent_projects(3)
+        )
         
         # Konfiguration
-        print("\nAktuelle Konfiguration:")
-        modules = self.config_manager.get_module_config()
-        for module, enabled in modules.items():
-            status = "✓" if enabled else "✗"
-            print(f"  {status} {module}")
+        lines.append("\nAktuelle Konfiguration:")
+        lines.extend(
+            f"  {'✓' if enabled else '✗'} {module}"
+            for module, enabled in self.config_manager.get_module_config().items()
+        )
         
         # Validierung
         errors = self.config_manager.validate_config()
         if errors:
-            print("\n⚠️ Konfigurationsprobleme:")
-            for error in errors:
-                print(f"  • {error}")
+            lines.append("\n⚠️ Konfigurationsprobleme:")
+            lines.extend(f"  • {error}" for error in errors)
         else:
-            print("\n✅ Konfiguration gültig")
+            lines.append("\n✅ Konfiguration gültig")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def test_functions(self):
         """Führt System-Tests durch."""
@@ -521,9 +620,7 @@ class ProjectRunner:
                     print(f"❌ {test_name}: FEHLER")
             except Exception as e:
                 print(f"❌ {test_name}: EXCEPTION - {e}")
-                if self.config_manager.get_setting('debug_mode', False):
-                    import traceback
-                    traceback.print_exc()
+                self.report_traceback()
     
     def test_directory_structure(self) -> bool:
         """Testet die Verzeichnis-Struktur."""
@@ -537,13 +634,25 @@ class ProjectRunner:
     def test_module_availability(self) -> bool:
         """Testet die Verfügbarkeit der Module."""
         required_modules = ['excel_reader', 'system_builder', 'optimizer', 'results_processor']
+        required_packages = ['oemof.solph', 'pyomo', 'pandas', 'openpyxl']
         
+        # find_spec prüft nur die Auffindbarkeit, ohne den Modulcode auszuführen
         for module_name in required_modules:
-            module_file = self.directories['modules'] / f"{module_name}.py"
-            if not module_file.exists():
+            if importlib.util.find_spec(f"modules.{module_name}") is None:
                 print(f"  ❌ {module_name}.py nicht gefunden")
                 return False
             print(f"  ✅ {module_name}.py")
+        
+        for package in required_packages:
+            try:
+                found = importlib.util.find_spec(package) is not None
+            except ModuleNotFoundError:
+                # Übergeordnetes Paket (z.B. 'oemof') fehlt
+                found = False
+            if not found:
+                print(f"  ❌ Paket '{package}' nicht installiert")
+                return False
+            print(f"  ✅ {package}")
         return True
     
     def test_configuration(self) -> bool:
@@ -595,9 +704,7 @@ class ProjectRunner:
                 break
             except Exception as e:
                 self.menu_system.show_error(f"Unerwarteter Fehler: {e}")
-                if self.config_manager.get_setting('debug_mode', False):
-                    import traceback
-                    traceback.print_exc()
+                self.report_traceback()
 
 
 def main():
@@ -609,7 +716,6 @@ def main():
         print("\n👋 Programm beendet.")
     except Exception as e:
         print(f"❌ Schwerwiegender Fehler: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
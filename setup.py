@@ -13,37 +13,65 @@ Datum: Juli 2025
 Version: 1.0.0
 """
 
+import functools
+import hashlib
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import yaml
 
+from utils.excel_utils import write_excel_sheets
+
+# libyaml-Emitter verwenden, falls PyYAML mit C-Erweiterung installiert ist
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 # Projektverzeichnisse
 PROJECT_ROOT = Path(__file__).parent
 EXAMPLES_DIR = PROJECT_ROOT / "examples"
 DATA_DIR = PROJECT_ROOT / "data"
 CONFIG_DIR = PROJECT_ROOT / "config"
 MODULES_DIR = PROJECT_ROOT / "modules"
+INPUT_DIR = DATA_DIR / "input"
+OUTPUT_DIR = DATA_DIR / "output"
+
+# Von setup_project_structure() angelegte Verzeichnisse
+PROJECT_DIRECTORIES = (EXAMPLES_DIR, INPUT_DIR, OUTPUT_DIR, CONFIG_DIR, MODULES_DIR)
+
+# Zeitschritte der Beispiele (1 Woche, ~1 Monat, ~3 Monate)
+_EXAMPLE_1_PERIODS = 168
+_EXAMPLE_2_PERIODS = 744
+_EXAMPLE_3_PERIODS = 2160
+
+# Ab dieser Gesamtzahl an Zeitschritten werden die Beispiele parallel erstellt
+_PARALLEL_MIN_PERIODS = 20_000
+
+# Gemeinsamer Zufallsgenerator der Profil-Funktionen (ganze Arrays pro Aufruf ziehen)
+_RNG_SEED = 42
+_RNG = np.random.default_rng(_RNG_SEED)
+
+# Wohnlastprofil: Grundlast und stündlicher Tagesfaktor (Index = Stunde)
+_RESIDENTIAL_BASE_LOAD = 0.3
+_RESIDENTIAL_DAY_FACTOR = np.array([0.7, 0.6, 0.6, 0.6, 0.7, 0.9, 1.2, 1.4, 1.1, 0.9, 0.8, 0.8,
+                                    0.9, 0.8, 0.8, 0.9, 1.1, 1.4, 1.6, 1.5, 1.3, 1.1, 0.9, 0.8],
+                                   dtype=np.float64)
 
 
 def setup_project_structure():
     """Erstellt die vollständige Projektstruktur."""
     print("🏗️  Erstelle Projektstruktur...")
     
-    # Verzeichnisse erstellen
-    directories = [
-        EXAMPLES_DIR,
-        DATA_DIR / "input",
-        DATA_DIR / "output", 
-        CONFIG_DIR,
-        MODULES_DIR
-    ]
-    
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+    # Bereits vorhandene Verzeichnisse überspringen (ein stat statt mkdir-Kette)
+    for directory in PROJECT_DIRECTORIES:
+        if not directory.is_dir():
+            os.makedirs(directory, exist_ok=True)
         print(f"   📁 {directory}")
     
     # __init__.py für modules Verzeichnis
@@ -73,7 +101,7 @@ def setup_project_structure():
         }
         
         with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(default_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(default_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
         print(f"   ⚙️  Standard-Konfiguration: {config_file}")
     
     print("✅ Projektstruktur erstellt")
@@ -84,43 +112,49 @@ def create_timeindex(start_date="2025-01-01", periods=8760, freq="h"):
     return pd.date_range(start=start_date, periods=periods, freq=freq)
 
 
-def create_load_profile(timeindex, annual_demand=1000, profile_type="residential"):
-    """Erstellt ein Lastprofil basierend auf dem Typ."""
+def calendar_arrays(timeindex) -> tuple:
+    """Liefert (Stunde, Tag im Jahr, Wochentag) eines Zeitindex als NumPy-Arrays."""
+    return (timeindex.hour.to_numpy(), timeindex.dayofyear.to_numpy(),
+            timeindex.weekday.to_numpy())
+
+
+def create_load_profile(timeindex, annual_demand=1000, profile_type="residential", calendar=None):
+    """
+    Erstellt ein Lastprofil basierend auf dem Typ.
+    
+    calendar kann vorberechnete calendar_arrays(timeindex) enthalten, damit
+    mehrere Profile desselben Zeitraums die Kalenderattribute nur einmal bilden.
+    """
     hours = len(timeindex)
     
     if profile_type == "residential":
         # Typisches Wohnlastprofil
-        base_load = 0.3
-        day_factor = np.array([0.7, 0.6, 0.6, 0.6, 0.7, 0.9, 1.2, 1.4, 1.1, 0.9, 0.8, 0.8,
-                              0.9, 0.8, 0.8, 0.9, 1.1, 1.4, 1.6, 1.5, 1.3, 1.1, 0.9, 0.8])
+        base_load = _RESIDENTIAL_BASE_LOAD
+        day_factor = _RESIDENTIAL_DAY_FACTOR
+        
+        # Kalenderattribute als Arrays (statt Schleife über alle Zeitstempel)
+        hour, day_of_year, weekday = calendar or calendar_arrays(timeindex)
+        
+        # Saisonale Variation
+        seasonal_factor = 1 + 0.3 * np.cos(2 * np.pi * (day_of_year - 30) / 365)
         
-        profile = []
-        for i, timestamp in enumerate(timeindex):
-            hour = timestamp.hour
-            day_of_year = timestamp.timetuple().tm_yday
-            
-            # Saisonale Variation
-            seasonal_factor = 1 + 0.3 * np.cos(2 * np.pi * (day_of_year - 30) / 365)
-            
-            # Wochentag/Wochenende
-            weekend_factor = 0.9 if timestamp.weekday() >= 5 else 1.0
-            
-            # Zufällige Variation
-            random_factor = 1 + 0.1 * (np.random.random() - 0.5)
-            
-            load = (base_load + day_factor[hour]) * seasonal_factor * weekend_factor * random_factor
-            profile.append(load)
+        # Wochentag/Wochenende
+        weekend_factor = np.where(weekday >= 5, 0.9, 1.0)
+        
+        # Zufällige Variation
+        random_factor = 1 + 0.1 * (_RNG.random(hours) - 0.5)
+        
+        profile = (base_load + day_factor[hour]) * seasonal_factor * weekend_factor * random_factor
         
         # Normalisieren auf jährlichen Bedarf
-        profile = np.array(profile)
-        profile = profile / profile.sum() * annual_demand
+        profile *= annual_demand / profile.sum()
         
     elif profile_type == "industrial":
         # Industrielles Lastprofil (relativ konstant)
         base_load = 0.8
         variation = 0.2
-        profile = base_load + variation * np.random.random(hours)
-        profile = profile / profile.sum() * annual_demand
+        profile = base_load + variation * _RNG.random(hours)
+        profile *= annual_demand / profile.sum()
         
     else:  # constant
         profile = np.full(hours, annual_demand / hours)
@@ -128,66 +162,150 @@ def create_load_profile(timeindex, annual_demand=1000, profile_type="residential
     return profile
 
 
-def create_renewable_profile(timeindex, technology="pv", capacity_factor=0.15):
-    """Erstellt Profile für erneuerbare Energien."""
+def create_renewable_profile(timeindex, technology="pv", capacity_factor=0.15, calendar=None):
+    """Erstellt Profile für erneuerbare Energien (calendar wie bei create_load_profile)."""
     hours = len(timeindex)
     
     if technology == "pv":
         # PV-Profil
-        profile = []
-        for timestamp in timeindex:
-            hour = timestamp.hour
-            day_of_year = timestamp.timetuple().tm_yday
-            
-            # Nur tagsüber
-            if 6 <= hour <= 18:
-                # Saisonale Variation
-                seasonal = 1 + 0.5 * np.cos(2 * np.pi * (day_of_year - 172) / 365)
-                
-                # Tagesverlauf (Sinuskurve)
-                daily = np.sin(np.pi * (hour - 6) / 12)
-                
-                # Zufällige Wolken
-                cloud_factor = 0.3 + 0.7 * np.random.random()
-                
-                output = seasonal * daily * cloud_factor
-            else:
-                output = 0
-            
-            profile.append(max(0, output))
+        hour, day_of_year, _ = calendar or calendar_arrays(timeindex)
+        
+        # Saisonale Variation
+        seasonal = 1 + 0.5 * np.cos(2 * np.pi * (day_of_year - 172) / 365)
+        
+        # Tagesverlauf (Sinuskurve)
+        daily = np.sin(np.pi * (hour - 6) / 12)
+        
+        # Zufällige Wolken
+        cloud_factor = 0.3 + 0.7 * _RNG.random(hours)
+        
+        # Nur tagsüber
+        profile = np.where((hour >= 6) & (hour <= 18), seasonal * daily * cloud_factor, 0.0)
+        np.clip(profile, 0, None, out=profile)
         
     elif technology == "wind":
-        # Wind-Profil (Weibull-ähnlich)
-        np.random.seed(42)  # Für Reproduzierbarkeit
-        profile = np.random.weibull(2, hours) * 2
-        profile = np.clip(profile, 0, 1)
+        # Wind-Profil (Weibull-ähnlich, Werte >= 0 - nur nach oben begrenzen)
+        profile = _RNG.weibull(2.0, hours)
+        profile *= 2.0
+        np.minimum(profile, 1.0, out=profile)
         
     else:  # constant
-        profile = np.full(hours, capacity_factor)
+        profile = np.full(hours, capacity_factor, dtype=np.float64)
     
-    return np.array(profile)
+    # Alle Zweige liefern bereits ein ndarray - keine weitere Kopie nötig
+    return profile
+
+
+# Feste Spalten des settings-Sheets (nur der Wert von timeindex_periods variiert)
+_SETTINGS_PARAMS = ('timeindex_start', 'timeindex_periods', 'timeindex_freq', 'solver')
+_SETTINGS_DESC = (
+    'Startdatum der Simulation',
+    'Anzahl Zeitschritte',
+    'Frequenz der Zeitschritte',
+    'Verwendeter Solver'
+)
+
+# Spalten des simple_transformers-Sheets und leere Vorlage (nur lesend verwendet)
+_TRANSFORMER_COLS = ['label', 'include', 'input_bus', 'output_bus', 'conversion_factor',
+                     'nominal_capacity', 'variable_costs', 'description']
+_EMPTY_TRANSFORMERS_DF = pd.DataFrame(columns=_TRANSFORMER_COLS)
+
+# Standardwerte des timestep_settings-Sheets (Reihenfolge = Zeilenreihenfolge)
+_TIMESTEP_SETTING_DEFAULTS = {
+    'timestep_strategy': 'full',
+    'time_range_start': '',
+    'time_range_end': '',
+    'averaging_hours': '4',
+    'sampling_n_factor': '1',
+    'enabled': 'False',
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _example_calendar(periods: int, start_date: str) -> tuple:
+    """Zeitindex und Kalender-Arrays eines Zeitraums, einmal für alle Profile berechnet."""
+    timeindex = create_timeindex(start_date, periods)
+    calendar = calendar_arrays(timeindex)
+    for array in calendar:
+        array.setflags(write=False)
+    return timeindex, calendar
 
 
-def create_timestep_settings_sheet() -> pd.DataFrame:
-    """Erstellt ein Excel-Sheet für Timestep-Einstellungen."""
+@functools.lru_cache(maxsize=16)
+def cached_load_profile(periods: int, annual_demand: float = 1000,
+                        profile_type: str = "residential",
+                        start_date: str = "2025-01-01") -> np.ndarray:
+    """
+    Wie create_load_profile, aber pro Parameter-Kombination nur einmal berechnet.
+    
+    Wiederholte Generierung der Beispiele (z.B. im Batch) überspringt die
+    Profil-Berechnung. Das Ergebnis ist schreibgeschützt, da es geteilt wird.
+    
+    Args:
+        periods: Anzahl stündlicher Zeitschritte
+        annual_demand: Energiebedarf über den Zeitraum
+        profile_type: residential, industrial oder constant
+        start_date: Startdatum des Zeitindex
+        
+    Returns:
+        Lastprofil als (schreibgeschütztes) Array
+    """
+    timeindex, calendar = _example_calendar(periods, start_date)
+    profile = create_load_profile(timeindex, annual_demand=annual_demand,
+                                  profile_type=profile_type, calendar=calendar)
+    profile.setflags(write=False)
+    return profile
+
+
+@functools.lru_cache(maxsize=16)
+def cached_renewable_profile(periods: int, technology: str = "pv",
+                             start_date: str = "2025-01-01") -> np.ndarray:
+    """
+    Wie create_renewable_profile, aber pro Parameter-Kombination nur einmal berechnet.
+    
+    Args:
+        periods: Anzahl stündlicher Zeitschritte
+        technology: pv, wind oder constant
+        start_date: Startdatum des Zeitindex
+        
+    Returns:
+        Erzeugungsprofil als (schreibgeschütztes) Array
+    """
+    timeindex, calendar = _example_calendar(periods, start_date)
+    profile = create_renewable_profile(timeindex, technology, calendar=calendar)
+    profile.setflags(write=False)
+    return profile
+
+
+def _settings_df(periods: int) -> pd.DataFrame:
+    """Erstellt das settings-Sheet eines Beispiels mit der gegebenen Anzahl Zeitschritte."""
+    return pd.DataFrame({
+        'Parameter': _SETTINGS_PARAMS,
+        'Value': ['2025-01-01', periods, 'h', 'cbc'],
+        'Description': _SETTINGS_DESC
+    })
+
+
+def create_timestep_settings_sheet(overrides: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Erstellt ein Excel-Sheet für Timestep-Einstellungen.
+    
+    Args:
+        overrides: Abweichende Werte je Parameter, z.B. {'timestep_strategy': 'averaging'}
+        
+    Returns:
+        DataFrame mit Parameter, Wert, Beschreibung und Beispielen
+    """
+    values = dict(_TIMESTEP_SETTING_DEFAULTS)
+    if overrides:
+        unknown = overrides.keys() - values.keys()
+        if unknown:
+            raise ValueError(f"Unbekannte Timestep-Parameter: {', '.join(sorted(unknown))}")
+        values.update(overrides)
     
     timestep_settings = pd.DataFrame({
-        'Parameter': [
-            'timestep_strategy',
-            'time_range_start',
-            'time_range_end', 
-            'averaging_hours',
-            'sampling_n_factor',
-            'enabled'
-        ],
-        'Value': [
-            'full',
-            '',
-            '',
-            '4',
-            '1',
-            'False'
-        ],
+        'Parameter': list(values),
+        'Value': list(values.values()),
         'Description': [
             'Strategie: full, time_range, averaging, sampling_24n',
             'Start-Datum für time_range (YYYY-MM-DD HH:MM)',
@@ -210,329 +328,377 @@ def create_timestep_settings_sheet() -> pd.DataFrame:
 
 
 def create_example_1_simple():
-    """Erstellt Beispiel 1: Einfaches System (PV + Netz + Last)."""
-    print("📋 Erstelle Beispiel 1: Einfaches System...")
+    """
+    Erstellt Beispiel 1: Einfaches System (PV + Netz + Last).
     
+    Returns:
+        Pfad der erstellten Datei
+    """
     # Zeitindex für eine Woche
-    timeindex = create_timeindex(periods=168, freq="h")  # 1 Woche
+    timeindex = create_timeindex(periods=_EXAMPLE_1_PERIODS, freq="h")
     
     # Excel-Datei erstellen
     filename = EXAMPLES_DIR / "example_1.xlsx"
     
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        
-        # Settings Sheet
-        settings_df = pd.DataFrame({
-            'Parameter': ['timeindex_start', 'timeindex_periods', 'timeindex_freq', 'solver'],
-            'Value': ['2025-01-01', 168, 'h', 'cbc'],
-            'Description': [
-                'Startdatum der Simulation',
-                'Anzahl Zeitschritte',
-                'Frequenz der Zeitschritte',
-                'Verwendeter Solver'
-            ]
-        })
-        settings_df.to_excel(writer, sheet_name='settings', index=False)
-        
-        # Timestep Settings Sheet (NEU)
-        timestep_settings_df = create_timestep_settings_sheet()
-        timestep_settings_df.to_excel(writer, sheet_name='timestep_settings', index=False)
-        
-        # Buses Sheet
-        buses_df = pd.DataFrame({
-            'label': ['el_bus'],
-            'include': [1],
-            'type': ['electrical'],
-            'description': ['Elektrischer Bus']
-        })
-        buses_df.to_excel(writer, sheet_name='buses', index=False)
-        
-        # Sources Sheet
-        pv_profile = create_renewable_profile(timeindex, "pv")
-        
-        sources_df = pd.DataFrame({
-            'label': ['pv_plant', 'grid_import'],
-            'include': [1, 1],
-            'bus': ['el_bus', 'el_bus'],
-            'nominal_capacity': [100, 1000],
-            'variable_costs': [0, 0.25],
-            'profile_column': ['pv_profile', ''],
-            'max_profile': ['', ''],
-            'description': ['PV-Anlage 100 kW', 'Netzeinspeisung unbegrenzt']
-        })
-        sources_df.to_excel(writer, sheet_name='sources', index=False)
-        
-        # Sinks Sheet
-        load_profile = create_load_profile(timeindex, annual_demand=100, profile_type="residential")
-        
-        sinks_df = pd.DataFrame({
-            'label': ['electrical_load', 'grid_export'],
-            'include': [1, 1],
-            'bus': ['el_bus', 'el_bus'],
-            'nominal_capacity': ['', 1000],
-            'variable_costs': [0, -0.08],
-            'profile_column': ['load_profile', ''],
-            'fix_profile': ['', ''],
-            'description': ['Elektrische Last', 'Netzausspeisung']
-        })
-        sinks_df.to_excel(writer, sheet_name='sinks', index=False)
-        
-        # Simple Transformers Sheet (leer für dieses Beispiel)
-        transformers_df = pd.DataFrame({
-            'label': [],
-            'include': [],
-            'input_bus': [],
-            'output_bus': [],
-            'conversion_factor': [],
-            'nominal_capacity': [],
-            'variable_costs': [],
-            'description': []
-        })
-        transformers_df.to_excel(writer, sheet_name='simple_transformers', index=False)
-        
-        # Zeitreihen Sheet
-        timeseries_df = pd.DataFrame({
-            'timestamp': timeindex,
-            'pv_profile': pv_profile,
-            'load_profile': load_profile
-        })
-        timeseries_df.to_excel(writer, sheet_name='timeseries', index=False)
+    sheets = {}
+    
+    # Settings Sheet
+    settings_df = _settings_df(periods=_EXAMPLE_1_PERIODS)
+    sheets['settings'] = settings_df
+    
+    # Timestep Settings Sheet (NEU)
+    timestep_settings_df = create_timestep_settings_sheet()
+    sheets['timestep_settings'] = timestep_settings_df
+    
+    # Buses Sheet
+    buses_df = pd.DataFrame({
+        'label': ['el_bus'],
+        'include': [1],
+        'type': ['electrical'],
+        'description': ['Elektrischer Bus']
+    })
+    sheets['buses'] = buses_df
+    
+    # Sources Sheet
+    pv_profile = cached_renewable_profile(len(timeindex), "pv")
+    
+    sources_df = pd.DataFrame({
+        'label': ['pv_plant', 'grid_import'],
+        'include': [1, 1],
+        'bus': ['el_bus', 'el_bus'],
+        'nominal_capacity': [100, 1000],
+        'variable_costs': [0, 0.25],
+        'profile_column': ['pv_profile', ''],
+        'max_profile': ['', ''],
+        'description': ['PV-Anlage 100 kW', 'Netzeinspeisung unbegrenzt']
+    })
+    sheets['sources'] = sources_df
+    
+    # Sinks Sheet
+    load_profile = cached_load_profile(len(timeindex), annual_demand=100, profile_type="residential")
+    
+    sinks_df = pd.DataFrame({
+        'label': ['electrical_load', 'grid_export'],
+        'include': [1, 1],
+        'bus': ['el_bus', 'el_bus'],
+        'nominal_capacity': ['', 1000],
+        'variable_costs': [0, -0.08],
+        'profile_column': ['load_profile', ''],
+        'fix_profile': ['', ''],
+        'description': ['Elektrische Last', 'Netzausspeisung']
+    })
+    sheets['sinks'] = sinks_df
     
-    print(f"   ✅ {filename}")
+    # Simple Transformers Sheet (leer für dieses Beispiel)
+    sheets['simple_transformers'] = _EMPTY_TRANSFORMERS_DF
+    
+    # Zeitreihen Sheet (spaltenweise, ohne zwischengeschalteten DataFrame)
+    sheets['timeseries'] = {
+        'timestamp': timeindex.to_pydatetime(),
+        'pv_profile': pv_profile,
+        'load_profile': load_profile
+    }
+    
+    write_excel_sheets(filename, sheets)
+    
+    return filename
 
 
 def create_example_2_medium():
-    """Erstellt Beispiel 2: Mittleres System (PV + Wind + Gas + Speicher)."""
-    print("📋 Erstelle Beispiel 2: Mittleres System...")
+    """
+    Erstellt Beispiel 2: Mittleres System (PV + Wind + Gas + Speicher).
     
+    Returns:
+        Pfad der erstellten Datei
+    """
     # Zeitindex für einen Monat
-    timeindex = create_timeindex(periods=744, freq="h")  # ~1 Monat
+    timeindex = create_timeindex(periods=_EXAMPLE_2_PERIODS, freq="h")
     
     filename = EXAMPLES_DIR / "example_2.xlsx"
     
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        
-        # Settings Sheet
-        settings_df = pd.DataFrame({
-            'Parameter': ['timeindex_start', 'timeindex_periods', 'timeindex_freq', 'solver'],
-            'Value': ['2025-01-01', 744, 'h', 'cbc'],
-            'Description': [
-                'Startdatum der Simulation',
-                'Anzahl Zeitschritte',
-                'Frequenz der Zeitschritte',
-                'Verwendeter Solver'
-            ]
-        })
-        settings_df.to_excel(writer, sheet_name='settings', index=False)
-        
-        # Timestep Settings Sheet (NEU) - Konfiguriert für 6h-Mittelwerte
-        timestep_settings_df = create_timestep_settings_sheet()
-        # Für mittleres Beispiel: 6h-Mittelwerte als Standard
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'timestep_strategy', 'Value'] = 'averaging'
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'averaging_hours', 'Value'] = '6'
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'enabled', 'Value'] = 'False'  # Standardmäßig deaktiviert
-        timestep_settings_df.to_excel(writer, sheet_name='timestep_settings', index=False)
-        
-        # Buses Sheet
-        buses_df = pd.DataFrame({
-            'label': ['el_bus', 'gas_bus'],
-            'include': [1, 1],
-            'type': ['electrical', 'gas'],
-            'description': ['Elektrischer Bus', 'Gas-Bus']
-        })
-        buses_df.to_excel(writer, sheet_name='buses', index=False)
-        
-        # Sources Sheet
-        pv_profile = create_renewable_profile(timeindex, "pv")
-        wind_profile = create_renewable_profile(timeindex, "wind")
-        
-        sources_df = pd.DataFrame({
-            'label': ['pv_plant', 'wind_plant', 'grid_import', 'gas_import'],
-            'include': [1, 1, 1, 1],
-            'bus': ['el_bus', 'el_bus', 'el_bus', 'gas_bus'],
-            'nominal_capacity': [200, 150, 500, 1000],
-            'variable_costs': [0, 0, 0.28, 0.04],
-            'profile_column': ['pv_profile', 'wind_profile', '', ''],
-            'max_profile': ['', '', '', ''],
-            'description': [
-                'PV-Anlage 200 kW',
-                'Windanlage 150 kW', 
-                'Netzeinspeisung',
-                'Gasversorgung'
-            ]
-        })
-        sources_df.to_excel(writer, sheet_name='sources', index=False)
-        
-        # Sinks Sheet
-        load_profile = create_load_profile(timeindex, annual_demand=300, profile_type="residential")
-        
-        sinks_df = pd.DataFrame({
-            'label': ['electrical_load', 'grid_export'],
-            'include': [1, 1],
-            'bus': ['el_bus', 'el_bus'],
-            'nominal_capacity': ['', 200],
-            'variable_costs': [0, -0.05],
-            'profile_column': ['load_profile', ''],
-            'fix_profile': ['', ''],
-            'description': ['Elektrische Last', 'Netzausspeisung']
-        })
-        sinks_df.to_excel(writer, sheet_name='sinks', index=False)
-        
-        # Simple Transformers Sheet
-        transformers_df = pd.DataFrame({
-            'label': ['gas_power_plant'],
-            'include': [1],
-            'input_bus': ['gas_bus'],
-            'output_bus': ['el_bus'],
-            'conversion_factor': [0.45],
-            'nominal_capacity': [100],
-            'variable_costs': [0.02],
-            'description': ['Gas-Kraftwerk 100 kW, η=45%']
-        })
-        transformers_df.to_excel(writer, sheet_name='simple_transformers', index=False)
-        
-        # Zeitreihen Sheet
-        timeseries_df = pd.DataFrame({
-            'timestamp': timeindex,
-            'pv_profile': pv_profile,
-            'wind_profile': wind_profile,
-            'load_profile': load_profile
-        })
-        timeseries_df.to_excel(writer, sheet_name='timeseries', index=False)
+    sheets = {}
+    
+    # Settings Sheet
+    settings_df = _settings_df(periods=_EXAMPLE_2_PERIODS)
+    sheets['settings'] = settings_df
     
-    print(f"   ✅ {filename}")
+    # Timestep Settings Sheet (NEU) - Konfiguriert für 6h-Mittelwerte
+    # Für mittleres Beispiel: 6h-Mittelwerte als Standard (standardmäßig deaktiviert)
+    timestep_settings_df = create_timestep_settings_sheet({
+        'timestep_strategy': 'averaging',
+        'averaging_hours': '6',
+        'enabled': 'False',
+    })
+    sheets['timestep_settings'] = timestep_settings_df
+    
+    # Buses Sheet
+    buses_df = pd.DataFrame({
+        'label': ['el_bus', 'gas_bus'],
+        'include': [1, 1],
+        'type': ['electrical', 'gas'],
+        'description': ['Elektrischer Bus', 'Gas-Bus']
+    })
+    sheets['buses'] = buses_df
+    
+    # Sources Sheet
+    pv_profile = cached_renewable_profile(len(timeindex), "pv")
+    wind_profile = cached_renewable_profile(len(timeindex), "wind")
+    
+    sources_df = pd.DataFrame({
+        'label': ['pv_plant', 'wind_plant', 'grid_import', 'gas_import'],
+        'include': [1, 1, 1, 1],
+        'bus': ['el_bus', 'el_bus', 'el_bus', 'gas_bus'],
+        'nominal_capacity': [200, 150, 500, 1000],
+        'variable_costs': [0, 0, 0.28, 0.04],
+        'profile_column': ['pv_profile', 'wind_profile', '', ''],
+        'max_profile': ['', '', '', ''],
+        'description': [
+            'PV-Anlage 200 kW',
+            'Windanlage 150 kW', 
+            'Netzeinspeisung',
+            'Gasversorgung'
+        ]
+    })
+    sheets['sources'] = sources_df
+    
+    # Sinks Sheet
+    load_profile = cached_load_profile(len(timeindex), annual_demand=300, profile_type="residential")
+    
+    sinks_df = pd.DataFrame({
+        'label': ['electrical_load', 'grid_export'],
+        'include': [1, 1],
+        'bus': ['el_bus', 'el_bus'],
+        'nominal_capacity': ['', 200],
+        'variable_costs': [0, -0.05],
+        'profile_column': ['load_profile', ''],
+        'fix_profile': ['', ''],
+        'description': ['Elektrische Last', 'Netzausspeisung']
+    })
+    sheets['sinks'] = sinks_df
+    
+    # Simple Transformers Sheet
+    transformers_df = pd.DataFrame({
+        'label': ['gas_power_plant'],
+        'include': [1],
+        'input_bus': ['gas_bus'],
+        'output_bus': ['el_bus'],
+        'conversion_factor': [0.45],
+        'nominal_capacity': [100],
+        'variable_costs': [0.02],
+        'description': ['Gas-Kraftwerk 100 kW, η=45%']
+    })
+    sheets['simple_transformers'] = transformers_df
+    
+    # Zeitreihen Sheet (spaltenweise, ohne zwischengeschalteten DataFrame)
+    sheets['timeseries'] = {
+        'timestamp': timeindex.to_pydatetime(),
+        'pv_profile': pv_profile,
+        'wind_profile': wind_profile,
+        'load_profile': load_profile
+    }
+    
+    write_excel_sheets(filename, sheets)
+    
+    return filename
 
 
 def create_example_3_complex():
-    """Erstellt Beispiel 3: Komplexes System mit Investment."""
-    print("📋 Erstelle Beispiel 3: Komplexes System...")
+    """
+    Erstellt Beispiel 3: Komplexes System mit Investment.
     
+    Returns:
+        Pfad der erstellten Datei
+    """
     # Zeitindex für 3 Monate
-    timeindex = create_timeindex(periods=2160, freq="h")  # ~3 Monate
+    timeindex = create_timeindex(periods=_EXAMPLE_3_PERIODS, freq="h")
     
     filename = EXAMPLES_DIR / "example_3.xlsx"
     
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        
-        # Settings Sheet
-        settings_df = pd.DataFrame({
-            'Parameter': ['timeindex_start', 'timeindex_periods', 'timeindex_freq', 'solver'],
-            'Value': ['2025-01-01', 2160, 'h', 'cbc'],
-            'Description': [
-                'Startdatum der Simulation',
-                'Anzahl Zeitschritte',
-                'Frequenz der Zeitschritte',
-                'Verwendeter Solver'
-            ]
-        })
-        settings_df.to_excel(writer, sheet_name='settings', index=False)
-        
-        # Timestep Settings Sheet (NEU) - Konfiguriert für Sampling
-        timestep_settings_df = create_timestep_settings_sheet()
-        # Für komplexes Beispiel: 24n+1 Sampling als Standard
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'timestep_strategy', 'Value'] = 'sampling_24n'
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'sampling_n_factor', 'Value'] = '0.25'  # Alle 6h
-        timestep_settings_df.loc[timestep_settings_df['Parameter'] == 'enabled', 'Value'] = 'False'  # Standardmäßig deaktiviert
-        timestep_settings_df.to_excel(writer, sheet_name='timestep_settings', index=False)
-        
-        # Buses Sheet
-        buses_df = pd.DataFrame({
-            'label': ['el_bus', 'heat_bus', 'gas_bus'],
-            'include': [1, 1, 1],
-            'type': ['electrical', 'heat', 'gas'],
-            'description': ['Elektrischer Bus', 'Wärme-Bus', 'Gas-Bus']
-        })
-        buses_df.to_excel(writer, sheet_name='buses', index=False)
-        
-        # Sources Sheet - mit Investment-Optionen
-        pv_profile = create_renewable_profile(timeindex, "pv")
-        wind_profile = create_renewable_profile(timeindex, "wind")
-        
-        sources_df = pd.DataFrame({
-            'label': ['pv_plant', 'wind_plant', 'grid_import', 'gas_import'],
-            'include': [1, 1, 1, 1],
-            'bus': ['el_bus', 'el_bus', 'el_bus', 'gas_bus'],
-            'nominal_capacity': ['INVEST', 'INVEST', 1000, 2000],
-            'variable_costs': [0, 0, 0.30, 0.045],
-            'investment_costs': [800, 1200, '', ''],
-            'invest_min': [0, 0, '', ''],
-            'invest_max': [500, 300, '', ''],
-            'profile_column': ['pv_profile', 'wind_profile', '', ''],
-            'description': [
-                'PV-Anlage (Investment)',
-                'Windanlage (Investment)',
-                'Netzeinspeisung',
-                'Gasversorgung'
-            ]
-        })
-        sources_df.to_excel(writer, sheet_name='sources', index=False)
-        
-        # Sinks Sheet
-        el_load_profile = create_load_profile(timeindex, annual_demand=800, profile_type="residential")
-        heat_load_profile = create_load_profile(timeindex, annual_demand=1200, profile_type="residential") * 1.5
-        
-        sinks_df = pd.DataFrame({
-            'label': ['electrical_load', 'heat_load', 'grid_export'],
-            'include': [1, 1, 1],
-            'bus': ['el_bus', 'heat_bus', 'el_bus'],
-            'nominal_capacity': ['', '', 300],
-            'variable_costs': [0, 0, -0.06],
-            'profile_column': ['el_load_profile', 'heat_load_profile', ''],
-            'description': [
-                'Elektrische Last',
-                'Wärmelast',
-                'Netzausspeisung'
-            ]
-        })
-        sinks_df.to_excel(writer, sheet_name='sinks', index=False)
-        
-        # Simple Transformers Sheet
-        transformers_df = pd.DataFrame({
-            'label': ['gas_power_plant', 'gas_boiler', 'heat_pump'],
-            'include': [1, 1, 1],
-            'input_bus': ['gas_bus', 'gas_bus', 'el_bus'],
-            'output_bus': ['el_bus', 'heat_bus', 'heat_bus'],
-            'conversion_factor': [0.42, 0.90, 3.5],
-            'nominal_capacity': ['INVEST', 200, 'INVEST'],
-            'variable_costs': [0.02, 0.01, 0.005],
-            'investment_costs': [600, '', 1000],
-            'invest_min': [0, '', 0],
-            'invest_max': [200, '', 150],
-            'description': [
-                'Gas-KW (Investment)',
-                'Gas-Kessel',
-                'Wärmepumpe (Investment)'
-            ]
-        })
-        transformers_df.to_excel(writer, sheet_name='simple_transformers', index=False)
-        
-        # Zeitreihen Sheet
-        timeseries_df = pd.DataFrame({
-            'timestamp': timeindex,
-            'pv_profile': pv_profile,
-            'wind_profile': wind_profile,
-            'el_load_profile': el_load_profile,
-            'heat_load_profile': heat_load_profile
-        })
-        timeseries_df.to_excel(writer, sheet_name='timeseries', index=False)
+    sheets = {}
+    
+    # Settings Sheet
+    settings_df = _settings_df(periods=_EXAMPLE_3_PERIODS)
+    sheets['settings'] = settings_df
+    
+    # Timestep Settings Sheet (NEU) - Konfiguriert für Sampling
+    # Für komplexes Beispiel: 24n+1 Sampling alle 6h als Standard (standardmäßig deaktiviert)
+    timestep_settings_df = create_timestep_settings_sheet({
+        'timestep_strategy': 'sampling_24n',
+        'sampling_n_factor': '0.25',
+        'enabled': 'False',
+    })
+    sheets['timestep_settings'] = timestep_settings_df
+    
+    # Buses Sheet
+    buses_df = pd.DataFrame({
+        'label': ['el_bus', 'heat_bus', 'gas_bus'],
+        'include': [1, 1, 1],
+        'type': ['electrical', 'heat', 'gas'],
+        'description': ['Elektrischer Bus', 'Wärme-Bus', 'Gas-Bus']
+    })
+    sheets['buses'] = buses_df
+    
+    # Sources Sheet - mit Investment-Optionen
+    pv_profile = cached_renewable_profile(len(timeindex), "pv")
+    wind_profile = cached_renewable_profile(len(timeindex), "wind")
+    
+    sources_df = pd.DataFrame({
+        'label': ['pv_plant', 'wind_plant', 'grid_import', 'gas_import'],
+        'include': [1, 1, 1, 1],
+        'bus': ['el_bus', 'el_bus', 'el_bus', 'gas_bus'],
+        'nominal_capacity': ['INVEST', 'INVEST', 1000, 2000],
+        'variable_costs': [0, 0, 0.30, 0.045],
+        'investment_costs': [800, 1200, '', ''],
+        'invest_min': [0, 0, '', ''],
+        'invest_max': [500, 300, '', ''],
+        'profile_column': ['pv_profile', 'wind_profile', '', ''],
+        'description': [
+            'PV-Anlage (Investment)',
+            'Windanlage (Investment)',
+            'Netzeinspeisung',
+            'Gasversorgung'
+        ]
+    })
+    sheets['sources'] = sources_df
+    
+    # Sinks Sheet
+    el_load_profile = cached_load_profile(len(timeindex), annual_demand=800, profile_type="residential")
+    heat_load_profile = cached_load_profile(len(timeindex), annual_demand=1200, profile_type="residential") * 1.5
+    
+    sinks_df = pd.DataFrame({
+        'label': ['electrical_load', 'heat_load', 'grid_export'],
+        'include': [1, 1, 1],
+        'bus': ['el_bus', 'heat_bus', 'el_bus'],
+        'nominal_capacity': ['', '', 300],
+        'variable_costs': [0, 0, -0.06],
+        'profile_column': ['el_load_profile', 'heat_load_profile', ''],
+        'description': [
+            'Elektrische Last',
+            'Wärmelast',
+            'Netzausspeisung'
+        ]
+    })
+    sheets['sinks'] = sinks_df
+    
+    # Simple Transformers Sheet
+    transformers_df = pd.DataFrame({
+        'label': ['gas_power_plant', 'gas_boiler', 'heat_pump'],
+        'include': [1, 1, 1],
+        'input_bus': ['gas_bus', 'gas_bus', 'el_bus'],
+        'output_bus': ['el_bus', 'heat_bus', 'heat_bus'],
+        'conversion_factor': [0.42, 0.90, 3.5],
+        'nominal_capacity': ['INVEST', 200, 'INVEST'],
+        'variable_costs': [0.02, 0.01, 0.005],
+        'investment_costs': [600, '', 1000],
+        'invest_min': [0, '', 0],
+        'invest_max': [200, '', 150],
+        'description': [
+            'Gas-KW (Investment)',
+            'Gas-Kessel',
+            'Wärmepumpe (Investment)'
+        ]
+    })
+    sheets['simple_transformers'] = transformers_df
+    
+    # Zeitreihen Sheet (spaltenweise, ohne zwischengeschalteten DataFrame)
+    sheets['timeseries'] = {
+        'timestamp': timeindex.to_pydatetime(),
+        'pv_profile': pv_profile,
+        'wind_profile': wind_profile,
+        'el_load_profile': el_load_profile,
+        'heat_load_profile': heat_load_profile
+    }
+    
+    write_excel_sheets(filename, sheets)
     
-    print(f"   ✅ {filename}")
+    return filename
+
+
+def _build_example(index: int) -> Path:
+    """
+    Erstellt ein Beispiel (seriell oder in einem Worker-Prozess).
+    
+    Der Zufallsgenerator wird pro Beispiel neu initialisiert, damit das Ergebnis
+    nicht von Reihenfolge oder Startmethode (fork/spawn) der Prozesse abhängt.
+    
+    Args:
+        index: Position in _EXAMPLE_BUILDERS
+        
+    Returns:
+        Pfad der erstellten Datei
+    """
+    global _RNG
+    _RNG = np.random.default_rng(_RNG_SEED)
+    builder, _, _ = _EXAMPLE_BUILDERS[index]
+    return builder()
+
 
+# Beispiel-Generatoren in Erstellungsreihenfolge: (Generator, Titel, Zeitschritte)
+_EXAMPLE_BUILDERS = (
+    (create_example_1_simple, "Einfaches System", _EXAMPLE_1_PERIODS),
+    (create_example_2_medium, "Mittleres System", _EXAMPLE_2_PERIODS),
+    (create_example_3_complex, "Komplexes System", _EXAMPLE_3_PERIODS),
+)
 
-def create_example_files():
-    """Erstellt alle drei Beispiel-Excel-Dateien."""
+
+# Quelldateien, von denen der Inhalt der Beispiele abhängt (Generatoren + Excel-Writer)
+_GENERATOR_SOURCES = (Path(__file__), PROJECT_ROOT / "utils" / "excel_utils.py")
+
+
+def _generator_signature() -> str:
+    """Kurzer Hash aller Generator-Quellen - ändert sich, sobald sich eine davon ändert."""
+    digest = hashlib.sha256()
+    for source in _GENERATOR_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def create_example_files(force: bool = False):
+    """
+    Erstellt alle drei Beispiel-Excel-Dateien.
+    
+    Sind alle Dateien vorhanden und mit der aktuellen Version der Generatoren
+    erzeugt worden (Signatur in examples/.sig), wird die Generierung übersprungen.
+    Erst ab _PARALLEL_MIN_PERIODS Zeitschritten insgesamt werden die Beispiele in
+    eigenen Prozessen erstellt; darunter kosten Prozessstart und pandas-Import
+    mehr als die eigentliche Arbeit.
+    
+    Args:
+        force: Beispiele unabhängig von der Signatur neu erstellen
+    """
     print("📁 Erstelle Beispiel-Excel-Dateien...")
     
     # Sicherstellen, dass das Verzeichnis existiert
     EXAMPLES_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Numpy Seed für reproduzierbare Zufallszahlen
-    np.random.seed(42)
-    
-    # Beispiele erstellen
-    create_example_1_simple()
-    create_example_2_medium()
-    create_example_3_complex()
+    signature = _generator_signature()
+    signature_file = EXAMPLES_DIR / ".sig"
+    example_files = [EXAMPLES_DIR / f"example_{i}.xlsx" for i in range(1, len(_EXAMPLE_BUILDERS) + 1)]
+    
+    if (not force and signature_file.is_file()
+            and signature_file.read_text(encoding='utf-8').strip() == signature
+            and all(example_file.is_file() for example_file in example_files)):
+        print("✅ Beispiele sind aktuell - Generierung übersprungen (--force erzwingt Neuerstellung)")
+        return
+    
+    total_periods = sum(periods for _, _, periods in _EXAMPLE_BUILDERS)
+    
+    if total_periods >= _PARALLEL_MIN_PERIODS:
+        # Große Beispiele sind unabhängig voneinander - parallel in eigenen Prozessen
+        # erstellen; Fortschritt gibt nur der Hauptprozess aus
+        print(f"📋 Erstelle {len(_EXAMPLE_BUILDERS)} Beispiele parallel...")
+        with ProcessPoolExecutor(max_workers=len(_EXAMPLE_BUILDERS)) as executor:
+            futures = {executor.submit(_build_example, index): index
+                       for index in range(len(_EXAMPLE_BUILDERS))}
+            for future in as_completed(futures):
+                index = futures[future]
+                print(f"   ✅ Beispiel {index + 1} ({_EXAMPLE_BUILDERS[index][1]}): {future.result()}")
+    else:
+        for index, (_, title, _) in enumerate(_EXAMPLE_BUILDERS):
+            print(f"📋 Erstelle Beispiel {index + 1}: {title}...")
+            print(f"   ✅ {_build_example(index)}")
+    
+    signature_file.write_text(signature, encoding='utf-8')
     
     print("✅ Alle Beispiele erstellt!")
     print(f"📁 Verfügbar in: {EXAMPLES_DIR}")
@@ -581,7 +747,7 @@ def main():
     print()
     
     # Beispiel-Excel-Dateien erstellen
-    create_example_files()
+    create_example_files(force='--force' in sys.argv[1:])
     print()
     
     print("🎉 Setup abgeschlossen!")
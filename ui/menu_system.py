@@ -13,6 +13,10 @@ Version: 1.0.0
 
 from typing import Dict, Any, Optional, Callable
 import logging
+import sys
+
+# Als Zustimmung gewertete Antworten in Bestätigungsabfragen
+_YES_RESPONSES = frozenset({'j', 'ja', 'y', 'yes'})
 
 
 class MenuSystem:
@@ -22,8 +26,36 @@ class MenuSystem:
         """Initialisiert das Menü-System."""
         self.logger = logging.getLogger(__name__)
         self.menu_options: Dict[str, Dict[str, Any]] = {}
+        # Bei Pipe/Skript-Aufruf direkt zeilenweise von stdin lesen
+        self.interactive = sys.stdin.isatty() and sys.stdout.isatty()
         self.setup_default_menu()
     
+    def prompt(self, message: str) -> str:
+        """
+        Liest eine Eingabezeile vom Benutzer.
+        
+        Im nicht-interaktiven Modus (Pipe, Skript) wird die Zeile direkt aus
+        dem gepufferten stdin gelesen, ohne den readline-Hook von input().
+        
+        Args:
+            message: Eingabeaufforderung
+            
+        Returns:
+            Eingelesene Zeile ohne Zeilenumbruch
+            
+        Raises:
+            EOFError: Wenn stdin erschöpft ist
+        """
+        if self.interactive:
+            return input(message)
+        
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    
     def setup_default_menu(self):
         """Richtet das Standard-Hauptmenü ein."""
         self.menu_options = {
@@ -91,7 +123,7 @@ class MenuSystem:
         if key in self.menu_options:
             self.menu_options[key]["handler"] = handler
         else:
-            self.logger.warning(f"Menü-Option '{key}' nicht gefunden")
+            self.logger.warning("Menü-Option '%s' nicht gefunden", key)
     
     def show_main_menu(self) -> str:
         """
@@ -107,9 +139,9 @@ class MenuSystem:
             print(f"{key}. {option['title']}")
         
         try:
-            choice = input("\nOption auswählen (1-7): ").strip()
+            choice = self.prompt("\nOption auswählen (1-7): ").strip()
             return choice
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n👋 Programm beendet.")
             return "7"
     
@@ -141,21 +173,21 @@ class MenuSystem:
             print("👋 Auf Wiedersehen!")
             return False
         
-        if choice not in self.menu_options:
+        option = self.menu_options.get(choice)
+        if option is None:
             print("❌ Ungültige Auswahl. Bitte wählen Sie 1-7.")
             return True
         
-        option = self.menu_options[choice]
         handler = option["handler"]
         
         if handler:
             try:
                 handler()
             except Exception as e:
-                self.logger.error(f"Fehler beim Ausführen von '{option['title']}': {e}")
+                self.logger.error("Fehler beim Ausführen von '%s': %s", option['title'], e)
                 print(f"❌ Fehler beim Ausführen von '{option['title']}': {e}")
         else:
-            self.logger.warning(f"Kein Handler für Option '{choice}' definiert")
+            self.logger.warning("Kein Handler für Option '%s' definiert", choice)
             print(f"❌ Funktion '{option['title']}' nicht verfügbar")
         
         return True
@@ -180,9 +212,9 @@ class MenuSystem:
             print(f"{key}. {description}")
         
         try:
-            choice = input(f"\n{prompt}").strip()
+            choice = self.prompt(f"\n{prompt}").strip()
             return choice if choice in options else None
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n❌ Abgebrochen.")
             return None
     
@@ -200,13 +232,13 @@ class MenuSystem:
         default_text = "(J/n)" if default else "(j/N)"
         
         try:
-            response = input(f"{message} {default_text}: ").strip().lower()
+            response = self.prompt(f"{message} {default_text}: ").strip().lower()
             
             if not response:
                 return default
                 
-            return response in ['j', 'ja', 'y', 'yes']
-        except KeyboardInterrupt:
+            return response in _YES_RESPONSES
+        except (KeyboardInterrupt, EOFError):
             print("\n❌ Abgebrochen.")
             return False
     
@@ -223,11 +255,11 @@ class MenuSystem:
         """
         try:
             if default:
-                response = input(f"{prompt} [{default}]: ").strip()
+                response = self.prompt(f"{prompt} [{default}]: ").strip()
                 return response if response else default
             else:
-                return input(f"{prompt}: ").strip()
-        except KeyboardInterrupt:
+                return self.prompt(f"{prompt}: ").strip()
+        except (KeyboardInterrupt, EOFError):
             print("\n❌ Abgebrochen.")
             return None
     
@@ -11,64 +11,96 @@ Datum: Juli 2025
 Version: 1.0.0
 """
 
+import heapq
+import importlib.util
+import os
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
 
+from ui.menu_system import MenuSystem
+
+# Verfügbarkeit optionaler Pakete einmalig prüfen (find_spec führt keinen Modulcode aus)
+PANDAS_AVAILABLE = importlib.util.find_spec('pandas') is not None
+
 
 class ProjectSelector:
     """Verwaltet die Auswahl und Anzeige von Projekten."""
     
-    def __init__(self, examples_dir: Path):
+    def __init__(self, examples_dir: Path, menu_system: Optional[MenuSystem] = None):
         """
         Initialisiert den Project Selector.
         
         Args:
             examples_dir: Verzeichnis mit Beispiel-Projekten
+            menu_system: Menü-System für Eingaben (Standard: eigene Instanz)
         """
         self.examples_dir = examples_dir
+        self.menu_system = menu_system or MenuSystem()
         self.available_projects: List[Dict[str, Any]] = []
         self.logger = logging.getLogger(__name__)
         
+        # Verzeichnis-mtime des letzten Scans (None = noch nicht gescannt)
+        self._projects_cache_mtime: Optional[int] = None
+        
         # Projekte initial laden
         self.load_available_projects()
     
     def load_available_projects(self):
-        """Lädt verfügbare Projekte aus dem examples/ Verzeichnis."""
-        self.available_projects = []
+        """
+        Lädt verfügbare Projekte aus dem examples/ Verzeichnis.
         
-        if not self.examples_dir.exists():
-            self.logger.warning(f"Examples-Verzeichnis nicht gefunden: {self.examples_dir}")
+        Das Verzeichnis wird nur neu gescannt, wenn sich seine Änderungszeit
+        seit dem letzten Scan geändert hat (Datei hinzugefügt/entfernt).
+        """
+        try:
+            mtime = self.examples_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.available_projects = []
+            self._projects_cache_mtime = None
+            self.logger.warning("Examples-Verzeichnis nicht gefunden: %s", self.examples_dir)
             return
         
-        excel_files = list(self.examples_dir.glob('*.xlsx'))
-        
-        for excel_file in excel_files:
-            # Temporäre Excel-Dateien ignorieren
-            if not excel_file.name.startswith('~'):
-                project_info = self._extract_project_info(excel_file)
-                self.available_projects.append(project_info)
-        
-        # Projekte alphabetisch sortieren
-        self.available_projects.sort(key=lambda x: x['name'])
+        if mtime == self._projects_cache_mtime:
+            return
         
-        self.logger.info(f"Gefunden: {len(self.available_projects)} verfügbare Projekte")
+        # Ein Durchlauf: Scan, Filter (temporäre ~$-Dateien ignorieren) und
+        # alphabetische Sortierung ohne Zwischenliste
+        with os.scandir(self.examples_dir) as entries:
+            self.available_projects = sorted(
+                (self._extract_project_info(Path(entry.path), entry.stat())
+                 for entry in entries
+                 if entry.is_file(follow_symlinks=False)
+                 and entry.name.endswith('.xlsx')
+                 and not entry.name.startswith('~')),
+                key=itemgetter('name')
+            )
+        self._projects_cache_mtime = mtime
+        
+        self.logger.info("Gefunden: %d verfügbare Projekte", len(self.available_projects))
     
-    def _extract_project_info(self, excel_file: Path) -> Dict[str, Any]:
+    def _extract_project_info(self, excel_file: Path,
+                              stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Extrahiert Projekt-Informationen aus einer Excel-Datei.
         
         Args:
             excel_file: Pfad zur Excel-Datei
+            stat_result: Bereits vorliegendes stat-Ergebnis (z.B. aus os.scandir)
             
         Returns:
             Dictionary mit Projekt-Informationen
         """
+        if stat_result is None:
+            stat_result = excel_file.stat()
+        
         project_info = {
             'name': excel_file.stem,
             'file': excel_file,
-            'size': excel_file.stat().st_size,
-            'modified': excel_file.stat().st_mtime,
+            'size': stat_result.st_size,
+            'modified': stat_result.st_mtime,
             'description': self._generate_description(excel_file)
         }
         
@@ -120,20 +152,23 @@ class ProjectSelector:
             print(f" {i}. 📋 {project['description']}")
         
         try:
-            choice = input("\nProjekt auswählen (Nummer): ").strip()
+            choice = self.menu_system.prompt("\nProjekt auswählen (Nummer): ").strip()
             project_idx = int(choice) - 1
             
             if 0 <= project_idx < len(self.available_projects):
                 selected_project = self.available_projects[project_idx]
-                self.logger.info(f"Projekt ausgewählt: {selected_project['name']}")
+                self.logger.info("Projekt ausgewählt: %s", selected_project['name'])
                 return selected_project
             else:
                 print("❌ Ungültige Auswahl.")
                 return None
                 
-        except (ValueError, KeyboardInterrupt):
+        except ValueError:
             print("❌ Ungültige Eingabe.")
             return None
+        except (KeyboardInterrupt, EOFError):
+            print("\n❌ Abgebrochen.")
+            return None
     
     def show_project_details(self, project: Dict[str, Any]):
         """
@@ -149,16 +184,13 @@ class ProjectSelector:
         print(f"Größe: {project['size']:,} Bytes")
         
         # Zeitstempel formatieren
-        import time
-        modified_time = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                     time.localtime(project['modified']))
-        print(f"Letzte Änderung: {modified_time}")
+        print(f"Letzte Änderung: {datetime.fromtimestamp(project['modified']):%Y-%m-%d %H:%M:%S}")
         
         # Zusätzliche Informationen aus der Excel-Datei extrahieren
         try:
             self._show_excel_info(project['file'])
         except Exception as e:
-            self.logger.warning(f"Konnte Excel-Informationen nicht laden: {e}")
+            self.logger.warning("Konnte Excel-Informationen nicht laden: %s", e)
     
     def _show_excel_info(self, excel_file: Path):
         """
@@ -167,6 +199,10 @@ class ProjectSelector:
         Args:
             excel_file: Pfad zur Excel-Datei
         """
+        if not PANDAS_AVAILABLE:
+            print("pandas nicht verfügbar - keine Excel-Details")
+            return
+        
         try:
             import pandas as pd
             
@@ -190,10 +226,8 @@ class ProjectSelector:
                 flows_df = pd.read_excel(excel_file, sheet_name='flows')
                 print(f"Flows: {len(flows_df)}")
             
-        except ImportError:
-            print("pandas nicht verfügbar - keine Excel-Details")
         except Exception as e:
-            self.logger.debug(f"Fehler beim Laden der Excel-Details: {e}")
+            self.logger.debug("Fehler beim Laden der Excel-Details: %s", e)
     
     def get_project_count(self) -> int:
         """
@@ -220,7 +254,13 @@ class ProjectSelector:
         return None
     
     def refresh_projects(self):
-        """Aktualisiert die Liste der verfügbaren Projekte."""
+        """
+        Aktualisiert die Liste der verfügbaren Projekte.
+        
+        Erzwingt einen neuen Scan: Wird eine vorhandene Datei überschrieben,
+        ändert sich die mtime des Verzeichnisses nicht.
+        """
+        self._projects_cache_mtime = None
         self.load_available_projects()
     
     def validate_project(self, project: Dict[str, Any]) -> bool:
@@ -237,17 +277,17 @@ class ProjectSelector:
         
         # Datei existiert?
         if not project_file.exists():
-            self.logger.error(f"Projekt-Datei nicht gefunden: {project_file}")
+            self.logger.error("Projekt-Datei nicht gefunden: %s", project_file)
             return False
         
         # Ist es eine Excel-Datei?
         if not project_file.suffix.lower() == '.xlsx':
-            self.logger.error(f"Ungültiger Dateityp: {project_file.suffix}")
+            self.logger.error("Ungültiger Dateityp: %s", project_file.suffix)
             return False
         
         # Mindestgröße?
         if project_file.stat().st_size < 1000:  # 1KB Minimum
-            self.logger.error(f"Datei zu klein: {project_file.stat().st_size} Bytes")
+            self.logger.error("Datei zu klein: %d Bytes", project_file.stat().st_size)
             return False
         
         # Kann geöffnet werden?
@@ -256,7 +296,7 @@ class ProjectSelector:
             pd.ExcelFile(project_file)
             return True
         except Exception as e:
-            self.logger.error(f"Kann Excel-Datei nicht öffnen: {e}")
+            self.logger.error("Kann Excel-Datei nicht öffnen: %s", e)
             return False
     
     def get_recent_projects(self, limit: int = 3) -> List[Dict[str, Any]]:
@@ -269,10 +309,7 @@ class ProjectSelector:
         Returns:
             Liste der zuletzt geänderten Projekte
         """
-        sorted_projects = sorted(self.available_projects, 
-                               key=lambda x: x['modified'], 
-                               reverse=True)
-        return sorted_projects[:limit]
+        return heapq.nlargest(limit, self.available_projects, key=itemgetter('modified'))
     
     def show_recent_projects(self):
         """Zeigt die zuletzt geänderten Projekte an."""
@@ -286,10 +323,8 @@ class ProjectSelector:
         print("-" * 40)
         
         for i, project in enumerate(recent_projects, 1):
-            import time
-            modified_time = time.strftime('%Y-%m-%d %H:%M', 
-                                         time.localtime(project['modified']))
-            print(f" {i}. 📋 {project['description']} ({modified_time})")
+            modified_time = datetime.fromtimestamp(project['modified'])
+            print(f" {i}. 📋 {project['description']} ({modified_time:%Y-%m-%d %H:%M})")
 
 
 # Test-Funktion
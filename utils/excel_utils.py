@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Excel Utilities für oemof.solph Energiesystem-Optimierung
+=======================================================
+
+Hilfsfunktionen zum Schreiben von Excel-Dateien (Beispiele, Vorlagen).
+Gemeinsam genutzt von setup.py und excel_template_creator.py.
+
+Autor: [Ihr Name]
+Datum: Juli 2025
+Version: 1.0.0
+"""
+
+from pathlib import Path
+
+from openpyxl import Workbook
+
+
+def write_excel_sheets(filename: Path, sheets: dict):
+    """
+    Schreibt DataFrames als Sheets in eine Excel-Datei.
+    
+    Verwendet den write-only Modus von openpyxl: Zeilen werden direkt in die
+    Datei gestreamt, ohne für jede Zelle ein Cell-Objekt im Speicher zu halten.
+    
+    Args:
+        filename: Ziel-Datei
+        sheets: Dictionary {Sheet-Name: DataFrame} in Sheet-Reihenfolge. Statt
+            eines DataFrames ist auch ein Dictionary {Spalte: Array} möglich
+            (z.B. Zeitreihen), das spaltenweise ohne pandas geschrieben wird.
+    """
+    workbook = Workbook(write_only=True)
+    
+    for sheet_name, data in sheets.items():
+        worksheet = workbook.create_sheet(sheet_name)
+        
+        if isinstance(data, dict):
+            # Spaltenweise Daten: Header + zeilenweises zip über die Arrays
+            worksheet.append(list(data))
+            columns = [column.tolist() if hasattr(column, 'tolist') else list(column)
+                       for column in data.values()]
+            for row in zip(*columns):
+                worksheet.append(row)
+            continue
+        
+        df = data
+        worksheet.append(list(df.columns))
+        
+        # Fehlende Werte als leere Zellen schreiben (wie DataFrame.to_excel)
+        if df.isna().values.any():
+            df = df.astype(object).where(df.notna(), None)
+        
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append(row)
+    
+    workbook.save(filename)
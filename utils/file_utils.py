@@ -19,6 +19,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 import logging
 
+# Als Zustimmung gewertete Antworten in Bestätigungsabfragen
+_YES_RESPONSES = frozenset({'j', 'ja', 'y', 'yes'})
+
 
 class FileUtils:
     """Hilfsfunktionen für Datei- und Verzeichnisoperationen."""
@@ -26,13 +29,18 @@ class FileUtils:
     def __init__(self):
         """Initialisiert die FileUtils."""
         self.logger = logging.getLogger(__name__)
+        
+        # Bereits geprüfte/erstellte Verzeichnisse (spart wiederholte stat-Aufrufe)
+        self._created_dirs = set()
     
-    def ensure_directory_structure(self, directories: Dict[str, Union[str, Path]]) -> Dict[str, Path]:
+    def ensure_directory_structure(self, directories: Dict[str, Union[str, Path]],
+                                   recheck: bool = False) -> Dict[str, Path]:
         """
         Stellt sicher, dass alle Verzeichnisse existieren.
         
         Args:
             directories: Dictionary mit Verzeichnis-Namen und Pfaden
+            recheck: Auch bereits bekannte Verzeichnisse erneut prüfen
             
         Returns:
             Dictionary mit Verzeichnis-Namen und Path-Objekten
@@ -42,14 +50,15 @@ class FileUtils:
         for name, path in directories.items():
             dir_path = Path(path)
             
-            if not dir_path.exists():
+            if (recheck or dir_path not in self._created_dirs) and not dir_path.is_dir():
                 try:
-                    dir_path.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(dir_path, exist_ok=True)
                     self.logger.info(f"Verzeichnis erstellt: {dir_path}")
                 except Exception as e:
                     self.logger.error(f"Fehler beim Erstellen von {name}: {e}")
                     raise
             
+            self._created_dirs.add(dir_path)
             created_directories[name] = dir_path
         
         return created_directories
@@ -66,7 +75,10 @@ class FileUtils:
             Pfad zum Output-Verzeichnis
         """
         output_dir = base_dir / project_name
+        # Nicht dem Cache vertrauen: das Verzeichnis kann inzwischen gelöscht
+        # worden sein (z.B. aufgeräumtes output/); mkdir mit exist_ok ist günstig
         output_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(output_dir)
         
         # Timestamp-Datei erstellen
         timestamp_file = output_dir / ".timestamp"
@@ -242,7 +254,7 @@ class FileUtils:
         
         if confirm:
             response = input(f"Datei '{file_path.name}' wirklich löschen? (j/N): ")
-            if response.lower() not in ['j', 'ja', 'y', 'yes']:
+            if response.strip().lower() not in _YES_RESPONSES:
                 self.logger.info("Löschen abgebrochen")
                 return False
         
@@ -398,10 +410,11 @@ class FileUtils:
         print(f"Existiert: {'Ja' if directory.exists() else 'Nein'}")
         
         if directory.exists():
-            # Anzahl Dateien und Unterverzeichnisse
-            files = list(directory.rglob('*'))
-            file_count = len([f for f in files if f.is_file()])
-            dir_count = len([f for f in files if f.is_dir()])
+            # Anzahl Dateien und Unterverzeichnisse (ein scandir-Durchlauf)
+            file_count = dir_count = 0
+            for _, dir_names, file_names in os.walk(directory):
+                dir_count += len(dir_names)
+                file_count += len(file_names)
             
             print(f"Dateien: {file_count}")
             print(f"Unterverzeichnisse: {dir_count}")